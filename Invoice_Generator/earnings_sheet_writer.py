@@ -51,6 +51,7 @@ class EarningsSheetWriter:
         currency: str,
         today_yyyymmdd: str,
         pay_by_yyyymmdd: str,
+        gc: Optional[gspread.Client] = None,
     ):
         self.config = config
         self.last_month_str = last_month_str
@@ -60,7 +61,9 @@ class EarningsSheetWriter:
         self.currency = currency
         self.today_yyyymmdd = today_yyyymmdd
         self.pay_by_yyyymmdd = pay_by_yyyymmdd
-        self._gc = None
+        # Client already authenticated by the caller (e.g. GoogleDocReader), if any;
+        # reusing it skips a second OAuth flow and connection setup
+        self._gc = gc
 
     def _setup_credentials(self) -> bool:
         """Setup Google Sheets credentials (same pattern as GoogleDocReader)."""
@@ -163,17 +166,28 @@ class EarningsSheetWriter:
         except Exception:
             return 1
 
-    def run(self) -> None:
+    def confirm(self) -> bool:
+        """Prompt user (Y/n) whether to add the earnings row. Returns False on 'n'/'no'."""
+        try:
+            response = input(
+                _prompt("Add row to overall list of earnings? (Y/n): ")
+            ).strip().lower()
+        except Exception as e:
+            print(_error(f"Failed to add earnings row: {e}"))
+            return False
+        return response not in ("n", "no")
+
+    def run(self, confirmed: Optional[bool] = None) -> None:
         """
         Prompt user (Y/n); if yes, append one row to the earnings sheet.
+        Pass confirmed to skip the prompt when confirm() was already asked.
         Does not exit the process on missing URL or write errors.
         """
+        if confirmed is None:
+            confirmed = self.confirm()
+        if not confirmed:
+            return
         try:
-            response = input(
-                _prompt("Add row to overall list of earnings? (Y/n): ")
-            ).strip().lower()
-            if response in ("n", "no"):
-                return
 
             url = os.getenv("GOOGLE_DOC_EARNINGS_LINK")
             if not url:
@@ -4,12 +4,75 @@ Google Docs Reader Class
 Reads work items from Google Sheets based on specified month and sheet name.
 """
 
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
 import os
 import re
 from datetime import datetime, date
-from typing import List, Dict, Optional, Tuple
-import gspread
-from google.oauth2.service_account import Credentials
+from typing import TYPE_CHECKING, List, Dict, Optional, Set, Tuple
+
+# gspread and google-auth are imported where they are used, they take a while to load
+if TYPE_CHECKING:
+    import gspread
+
+logger = logging.getLogger(__name__)
+
+# Authenticated clients shared by all readers, keyed by (credentials_path, authorized_user_path)
+_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str]], gspread.Client] = {}
+
+# Date formats accepted in column A, tried in order
+DATE_FORMATS = (
+    '%Y-%m-%d',      # 2025-08-01
+    '%m/%d/%Y',      # 08/01/2025
+    '%d/%m/%Y',      # 01/08/2025
+    '%Y-%m-%d %H:%M:%S',  # 2025-08-01 10:30:00
+    '%m/%d/%Y %H:%M:%S',  # 08/01/2025 10:30:00
+)
+
+# Shape checks for the common formats; plain dates are built straight from the
+# captured groups, only the " HH:MM:SS" variants still go through strptime
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+_SLASH_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')
+
+# Matches a Google Sheets URL and captures the sheet ID
+_SHEET_ID_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)')
+
+# (credentials_path, authorized_user_path) found on disk, looked up once per process
+_DISCOVERED_CREDENTIAL_FILES: Optional[Tuple[Optional[str], Optional[str]]] = None
+
+# Common locations of the OAuth2 client secret / service account file
+_CREDENTIALS_PATHS = (
+    '/Users/vasilenkoilya/Documents/7 GitHub Cursor/cms-assistant/.vscode/client_secret_1049835516666-5v9s988evv40904gof6p0i7l93f57go7.apps.googleusercontent.com.json',
+    'credentials.json',
+    'client_secret.json',
+    os.path.expanduser('~/.config/gspread/credentials.json'),
+)
+
+# Common locations of the saved OAuth2 tokens
+_AUTHORIZED_USER_PATHS = (
+    '.vscode/authorized_user.json',
+    'authorized_user.json',
+    os.path.expanduser('~/.config/gspread/authorized_user.json'),
+)
+
+
+def _discover_credential_files() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find the first existing credentials and authorized user files.
+    
+    Returns:
+        Tuple[Optional[str], Optional[str]]: (credentials_path, authorized_user_path)
+    """
+    global _DISCOVERED_CREDENTIAL_FILES
+    if _DISCOVERED_CREDENTIAL_FILES is None:
+        _DISCOVERED_CREDENTIAL_FILES = (
+            next((path for path in _CREDENTIALS_PATHS if os.path.exists(path)), None),
+            next((path for path in _AUTHORIZED_USER_PATHS if os.path.exists(path)), None),
+        )
+    return _DISCOVERED_CREDENTIAL_FILES
 
 class GoogleDocReader:
     """
@@ -37,86 +100,118 @@ class GoogleDocReader:
         self.sheet_name = sheet_name
         self.period_from = period_from
         self.period_to = period_to
-        self.work_items = []
+        self._clear_work_items()
         self._sheet = None
+        # Columns A:E fetched once per connection, shared by all readers below
+        self._all_values: Optional[List[List[str]]] = None
+        # Parsed dates keyed by raw cell text; sheets repeat the same dates a lot
+        self._date_cache: Dict[str, Optional[date]] = {}
+        # 'YYYY-MM' prefixes of all months in the period, to reject rows early
+        self._month_prefixes = self._period_month_prefixes(period_from, period_to)
+        self._period_years = {str(year) for year in range(period_from.year, period_to.year + 1)}
         self._setup_credentials()
     
     def _setup_credentials(self):
-        """Setup Google Sheets credentials."""
+        """Setup Google Sheets credentials, reusing a client authenticated earlier in this process."""
         try:
-            # Try OAuth2 authentication with custom credentials file
-            credentials_path = os.getenv('GOOGLE_CREDENTIALS_PATH')
-            if not credentials_path:
-                # Try to find the credentials file in common locations
-                possible_paths = [
-                    '/Users/vasilenkoilya/Documents/7 GitHub Cursor/cms-assistant/.vscode/client_secret_1049835516666-5v9s988evv40904gof6p0i7l93f57go7.apps.googleusercontent.com.json',
-                    'credentials.json',
-                    'client_secret.json',
-                    os.path.expanduser('~/.config/gspread/credentials.json')
-                ]
-                
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        credentials_path = path
-                        break
+            # Try OAuth2 authentication with custom credentials file,
+            # otherwise fall back to the files found in common locations
+            discovered_credentials_path, authorized_user_path = _discover_credential_files()
+            credentials_path = os.getenv('GOOGLE_CREDENTIALS_PATH') or discovered_credentials_path
             
-            if credentials_path and os.path.exists(credentials_path):
-                print(f"Using credentials file: {credentials_path}")
-                try:
-                    # Look for authorized_user.json in common locations
-                    authorized_user_paths = [
-                        '.vscode/authorized_user.json',
-                        'authorized_user.json',
-                        os.path.expanduser('~/.config/gspread/authorized_user.json')
-                    ]
-                    
-                    authorized_user_path = None
-                    for path in authorized_user_paths:
-                        if os.path.exists(path):
-                            authorized_user_path = path
-                            break
-                    
-                    # Use OAuth2 with custom credentials file
-                    self._gc = gspread.oauth(
-                        credentials_filename=credentials_path,
-                        authorized_user_filename=authorized_user_path
-                    )
-                    print("Successfully authenticated using OAuth2")
-                    return
-                except Exception as oauth_error:
-                    print(f"OAuth2 authentication failed: {oauth_error}")
-                    print("Trying service account authentication...")
-                    
-                    # Fallback to service account credentials
-                    try:
-                        scope = ['https://spreadsheets.google.com/feeds',
-                                'https://www.googleapis.com/auth/drive']
-                        creds = Credentials.from_service_account_file(credentials_path, scopes=scope)
-                        self._gc = gspread.authorize(creds)
-                        print("Successfully authenticated using service account")
-                        return
-                    except Exception as sa_error:
-                        print(f"Service account authentication also failed: {sa_error}")
-            
-            # Try default OAuth2 authentication
-            try:
-                self._gc = gspread.oauth()
-                print("Successfully authenticated using default OAuth2")
+            cache_key = (credentials_path, authorized_user_path)
+            if cache_key in _CLIENT_CACHE:
+                self._gc = _CLIENT_CACHE[cache_key]
                 return
-            except Exception as oauth_error:
-                print(f"Default OAuth2 authentication failed: {oauth_error}")
             
-            print("No authentication method available.")
-            print("Please either:")
-            print("1. Set GOOGLE_CREDENTIALS_PATH environment variable to your credentials JSON file")
-            print("2. Place your credentials file as 'credentials.json' in the project directory")
-            print("3. Run 'gspread auth' to set up OAuth2 authentication")
-            self._gc = None
+            self._gc = self._authenticate(credentials_path, authorized_user_path)
+            if self._gc is not None:
+                _CLIENT_CACHE[cache_key] = self._gc
             
         except Exception as e:
-            print(f"Error setting up credentials: {e}")
+            logger.error("Error setting up credentials: %s", e)
             self._gc = None
     
+    @property
+    def client(self) -> Optional[gspread.Client]:
+        """Authenticated gspread client, shared with other readers using the same credentials."""
+        return self._gc
+    
+    @staticmethod
+    def _authenticate(credentials_path: Optional[str], authorized_user_path: Optional[str]) -> Optional[gspread.Client]:
+        """
+        Authenticate against Google Sheets: OAuth2 with the credentials file,
+        then a service account from the same file, then default OAuth2.
+        
+        Args:
+            credentials_path (Optional[str]): Path to the client secret / service account JSON
+            authorized_user_path (Optional[str]): Path to saved OAuth2 tokens
+            
+        Returns:
+            Optional[gspread.Client]: Authenticated client, or None if every method failed
+        """
+        import gspread
+        from google.oauth2.service_account import Credentials
+        
+        if credentials_path and os.path.exists(credentials_path):
+            logger.info("Using credentials file: %s", credentials_path)
+            try:
+                # Use OAuth2 with custom credentials file
+                client = gspread.oauth(
+                    credentials_filename=credentials_path,
+                    authorized_user_filename=authorized_user_path
+                )
+                logger.info("Successfully authenticated using OAuth2")
+                return client
+            except Exception as oauth_error:
+                logger.warning("OAuth2 authentication failed: %s", oauth_error)
+                logger.info("Trying service account authentication...")
+                
+                # Fallback to service account credentials
+                try:
+                    scope = ['https://spreadsheets.google.com/feeds',
+                            'https://www.googleapis.com/auth/drive']
+                    creds = Credentials.from_service_account_file(credentials_path, scopes=scope)
+                    client = gspread.authorize(creds)
+                    logger.info("Successfully authenticated using service account")
+                    return client
+                except Exception as sa_error:
+                    logger.warning("Service account authentication also failed: %s", sa_error)
+        
+        # Try default OAuth2 authentication
+        try:
+            client = gspread.oauth()
+            logger.info("Successfully authenticated using default OAuth2")
+            return client
+        except Exception as oauth_error:
+            logger.warning("Default OAuth2 authentication failed: %s", oauth_error)
+        
+        logger.error("No authentication method available.")
+        logger.error("Please either:")
+        logger.error("1. Set GOOGLE_CREDENTIALS_PATH environment variable to your credentials JSON file")
+        logger.error("2. Place your credentials file as 'credentials.json' in the project directory")
+        logger.error("3. Run 'gspread auth' to set up OAuth2 authentication")
+        return None
+    
+    @staticmethod
+    def _period_month_prefixes(period_from: date, period_to: date) -> Set[str]:
+        """
+        Build the 'YYYY-MM' prefixes of every month touched by the period.
+        
+        Args:
+            period_from (date): Start date of the period (inclusive)
+            period_to (date): End date of the period (inclusive)
+            
+        Returns:
+            Set[str]: Month prefixes, e.g. {'2025-08', '2025-09'}
+        """
+        prefixes = set()
+        year, month = period_from.year, period_from.month
+        while (year, month) <= (period_to.year, period_to.month):
+            prefixes.add(f"{year:04d}-{month:02d}")
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return prefixes
+    
     def _extract_sheet_id(self, url: str) -> Optional[str]:
         """
         Extract sheet ID from Google Sheets URL.
@@ -127,15 +222,35 @@ class GoogleDocReader:
         Returns:
             Optional[str]: Sheet ID if found, None otherwise
         """
-        # Pattern to match Google Sheets URL and extract sheet ID
-        pattern = r'/spreadsheets/d/([a-zA-Z0-9-_]+)'
-        match = re.search(pattern, url)
+        match = _SHEET_ID_RE.search(url)
         return match.group(1) if match else None
     
     def _parse_date(self, date_str: str) -> Optional[date]:
         """
         Parse date string into date object.
         
+        Results are memoized per raw string, so each distinct date in the
+        sheet goes through strptime only once.
+        
+        Args:
+            date_str (str): Date string in various formats
+            
+        Returns:
+            Optional[date]: Parsed date or None if parsing fails
+        """
+        if date_str in self._date_cache:
+            return self._date_cache[date_str]
+        
+        parsed_date = self._parse_date_uncached(date_str)
+        self._date_cache[date_str] = parsed_date
+        return parsed_date
+    
+    @staticmethod
+    def _parse_date_uncached(date_str: str) -> Optional[date]:
+        """
+        Parse date string into date object. Only the formats matching the
+        string's shape are tried; unknown shapes fall back to DATE_FORMATS.
+        
         Args:
             date_str (str): Date string in various formats
             
@@ -147,19 +262,36 @@ class GoogleDocReader:
             
         date_str = date_str.strip()
         
-        # Try different date formats
-        date_formats = [
-            '%Y-%m-%d',      # 2025-08-01
-            '%m/%d/%Y',      # 08/01/2025
-            '%d/%m/%Y',      # 01/08/2025
-            '%Y-%m-%d %H:%M:%S',  # 2025-08-01 10:30:00
-            '%m/%d/%Y %H:%M:%S',  # 08/01/2025 10:30:00
-        ]
+        # Pick the candidate formats from the shape of the string; a trailing
+        # remainder after the date part means the " HH:MM:SS" variant.
+        match = _ISO_DATE_RE.match(date_str)
+        if match:
+            if match.end() == len(date_str):
+                year, month, day = match.groups()
+                try:
+                    return date(int(year), int(month), int(day))
+                except ValueError:
+                    return None
+            candidates = ('%Y-%m-%d %H:%M:%S',)
+        else:
+            match = _SLASH_DATE_RE.match(date_str)
+            if match:
+                if match.end() == len(date_str):
+                    first, second, year = (int(part) for part in match.groups())
+                    # MM/DD/YYYY wins over DD/MM/YYYY, as in DATE_FORMATS
+                    for month, day in ((first, second), (second, first)):
+                        try:
+                            return date(year, month, day)
+                        except ValueError:
+                            continue
+                    return None
+                candidates = ('%m/%d/%Y %H:%M:%S',)
+            else:
+                candidates = DATE_FORMATS
         
-        for fmt in date_formats:
+        for fmt in candidates:
             try:
-                parsed_date = datetime.strptime(date_str, fmt).date()
-                return parsed_date
+                return datetime.strptime(date_str, fmt).date()
             except ValueError:
                 continue
         
@@ -195,18 +327,6 @@ class GoogleDocReader:
             f"Invalid hours value {raw!r}: expected a number, or text containing 'waived'"
         )
     
-    def _is_in_target_period(self, item_date: date) -> bool:
-        """
-        Check if the item date is within the target period.
-        
-        Args:
-            item_date (date): Date to check
-            
-        Returns:
-            bool: True if date is in target period, False otherwise
-        """
-        return self.period_from <= item_date <= self.period_to
-    
     def connect(self) -> bool:
         """
         Connect to the Google Sheet.
@@ -215,32 +335,117 @@ class GoogleDocReader:
             bool: True if connection successful, False otherwise
         """
         if not self._gc:
-            print("Error: No Google Sheets credentials available")
+            logger.error("Error: No Google Sheets credentials available")
             return False
         
         try:
             sheet_id = self._extract_sheet_id(self.url)
             if not sheet_id:
-                print(f"Error: Could not extract sheet ID from URL: {self.url}")
+                logger.error("Error: Could not extract sheet ID from URL: %s", self.url)
                 return False
             
             # Open the spreadsheet
             spreadsheet = self._gc.open_by_key(sheet_id)
             
             # Get the specific worksheet
+            import gspread
             try:
                 self._sheet = spreadsheet.worksheet(self.sheet_name)
+                self._all_values = None
             except gspread.WorksheetNotFound:
-                print(f"Error: Worksheet '{self.sheet_name}' not found")
+                logger.error("Error: Worksheet '%s' not found", self.sheet_name)
                 return False
             
-            print(f"Successfully connected to sheet: {self.sheet_name}")
+            logger.info("Successfully connected to sheet: %s", self.sheet_name)
             return True
             
         except Exception as e:
-            print(f"Error connecting to Google Sheet: {e}")
+            logger.error("Error connecting to Google Sheet: %s", e)
             return False
     
+    def _resolve_period_dates(self, date_strs: Set[str]) -> Dict[str, Optional[date]]:
+        """
+        Map each distinct column A value to its date if it falls in the target period.
+        
+        Args:
+            date_strs (Set[str]): Distinct raw date cells
+            
+        Returns:
+            Dict[str, Optional[date]]: Parsed date, or None for unparseable or
+            out-of-period values
+        """
+        period_dates: Dict[str, Optional[date]] = {}
+        period_from, period_to = self.period_from, self.period_to
+        month_prefixes = self._month_prefixes
+        period_years = self._period_years
+        for date_str in date_strs:
+            # Zero-padded ISO dates from other months are rejected by prefix,
+            # slash dates (MM/DD/YYYY or DD/MM/YYYY) from other years by suffix
+            if ((date_str[4:5] == '-' and date_str[7:8] == '-'
+                    and date_str[:7] not in month_prefixes)
+                    or (date_str[-5:-4] == '/' and date_str[-4:] not in period_years)):
+                period_dates[date_str] = None
+                continue
+            
+            item_date = self._parse_date(date_str)
+            if item_date and period_from <= item_date <= period_to:
+                period_dates[date_str] = item_date
+            else:
+                period_dates[date_str] = None
+        return period_dates
+    
+    def _get_all_values(self) -> List[List[str]]:
+        """
+        Fetch columns A:E of the sheet, once per connection.
+        
+        Work items (A:D) and the currency/hourly rate cells (E1:E2) are read
+        from the same response, so the sheet is only downloaded once no matter
+        which of the public readers is called first.
+        
+        Returns:
+            List[List[str]]: Rows of the sheet, padded to equal length
+        """
+        if self._all_values is None:
+            self._all_values = self._sheet.get_values('A:E')
+        return self._all_values
+    
+    def _clear_work_items(self):
+        """Reset the work item columns."""
+        # Work items are kept column-wise (one list per field); the list of
+        # dicts exposed as work_items is only built when it is asked for
+        self._dates: List[date] = []
+        self._topics: List[str] = []
+        self._working_items: List[str] = []
+        self._hours: List[float] = []
+        self._hours_displays: List[Optional[str]] = []
+        self._total_hours = 0.0
+        self._work_items: Optional[List[Dict]] = None
+    
+    @property
+    def work_items(self) -> List[Dict]:
+        """
+        Work items as dicts, built from the columns on first access.
+        
+        Returns:
+            List[Dict]: Work items with keys: date, topic, working_item, hours,
+            and optionally hours_display
+        """
+        if self._work_items is None:
+            self._work_items = []
+            for item_date, topic, working_item, hours, hours_display in zip(
+                self._dates, self._topics, self._working_items, self._hours, self._hours_displays
+            ):
+                work_item = {
+                    'date': item_date,
+                    'topic': topic,
+                    'working_item': working_item,
+                    'hours': hours,
+                }
+                if hours_display is not None:
+                    work_item['hours_display'] = hours_display
+                self._work_items.append(work_item)
+        return self._work_items
+    
     def retrieve_work_items(self) -> List[Dict]:
         """
         Retrieve all work items from the specified sheet for the target period.
@@ -250,70 +455,95 @@ class GoogleDocReader:
             billed total), and optionally hours_display (original cell text for waived rows).
         """
         if not self._sheet:
-            print("Error: Not connected to sheet. Call connect() first.")
+            logger.error("Error: Not connected to sheet. Call connect() first.")
             return []
         
-        self.work_items = []
+        self._clear_work_items()
         
         try:
             # Get all values from the sheet
-            all_values = self._sheet.get_all_values()
+            all_values = self._get_all_values()
             
             if not all_values:
-                print("No data found in the sheet")
+                logger.warning("No data found in the sheet")
                 return []
             
-            # Process each row (skip header if present)
-            for row_idx, row in enumerate(all_values):
-                if len(row) < 4:  # Need at least 4 columns
-                    continue
-                
-                # Parse date from column A
-                date_str = row[0] if len(row) > 0 else ''
-                item_date = self._parse_date(date_str)
-                
-                if not item_date:
-                    continue  # Skip rows without valid dates
+            # Only rows with at least 4 columns can hold a work item
+            rows = [row for row in all_values if len(row) >= 4]
+            
+            # Resolve column A once per distinct value: in-period date or None
+            period_dates = self._resolve_period_dates({row[0] for row in rows})
+            
+            # Process each row (header and rows outside the period resolve to None)
+            for row in rows:
+                # Columns A-D: date, topic, working item, hours
+                date_str, topic, working_item, hours_str = row[:4]
                 
-                # Check if date is in target period
-                if not self._is_in_target_period(item_date):
+                item_date = period_dates[date_str]
+                if item_date is None:
                     continue
                 
-                # Extract work item data
-                topic = row[1] if len(row) > 1 else ''
-                working_item = row[2] if len(row) > 2 else ''
-                hours_str = row[3] if len(row) > 3 else ''
                 hours, hours_display = self._parse_hours_field(hours_str)
-
-                work_item = {
-                    'date': item_date,
-                    'topic': topic.strip(),
-                    'working_item': working_item.strip(),
-                    'hours': hours,
-                }
-                if hours_display is not None:
-                    work_item['hours_display'] = hours_display
-
-                self.work_items.append(work_item)
+                
+                self._dates.append(item_date)
+                self._topics.append(topic.strip())
+                self._working_items.append(working_item.strip())
+                self._hours.append(hours)
+                self._hours_displays.append(hours_display)
             
-            # Format period display for logging
-            if self.period_from == self.period_to:
-                period_display = self.period_from.strftime('%B %Y')
-            else:
-                period_display = f"{self.period_from.strftime('%B %Y')} to {self.period_to.strftime('%B %Y')}"
+            # Total is taken while the hours column is fresh, compute_total_hours() just reads it
+            # (fsum avoids drift when adding up many fractional hours)
+            self._total_hours = math.fsum(self._hours)
             
-            print(f"Found {len(self.work_items)} work items for {period_display}")
+            if logger.isEnabledFor(logging.INFO):
+                # Format period display for logging
+                if self.period_from == self.period_to:
+                    period_display = self.period_from.strftime('%B %Y')
+                else:
+                    period_display = f"{self.period_from.strftime('%B %Y')} to {self.period_to.strftime('%B %Y')}"
+                
+                logger.info("Found %d work items for %s", len(self._dates), period_display)
             return self.work_items
 
         except ValueError:
             raise
         except Exception as e:
-            print(f"Error retrieving work items: {e}")
+            logger.error("Error retrieving work items: %s", e)
             return []
     
+    async def retrieve_work_items_async(self) -> List[Dict]:
+        """
+        Async variant of retrieve_work_items.
+        
+        The blocking sheet download runs in the default thread pool, so several
+        readers (different sheets or periods) can fetch concurrently.
+        
+        Returns:
+            List[Dict]: Same as retrieve_work_items
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.retrieve_work_items)
+    
+    def fetch_sheet_data(self) -> Tuple[List[Dict], str, float]:
+        """
+        Retrieve the work items together with the currency and hourly rate.
+        
+        Both come out of the same A:E values request, so this is a single
+        round-trip to the Sheets API.
+        
+        Returns:
+            Tuple[List[Dict], str, float]: (work_items, currency, hourly_rate)
+            
+        Raises:
+            ValueError: If an hours cell, the currency or the hourly rate is invalid
+        """
+        work_items = self.retrieve_work_items()
+        currency, hourly_rate = self.read_currency_and_hourly_rate()
+        return (work_items, currency, hourly_rate)
+    
     def print_all_items(self):
         """Print all work items found."""
-        if not self.work_items:
+        if not self._dates:
             print("No work items found.")
             return
         
@@ -323,26 +553,35 @@ class GoogleDocReader:
         else:
             period_display = f"{self.period_from.strftime('%B %Y')} to {self.period_to.strftime('%B %Y')}"
         
-        print(f"\nWork Items for {period_display}:")
-        print("-" * 80)
-        print(f"{'Date':<12} {'Topic':<20} {'Working Item':<30} {'Hours':<8}")
-        print("-" * 80)
+        separator = "-" * 80
+        lines = [
+            f"\nWork Items for {period_display}:",
+            separator,
+            f"{'Date':<12} {'Topic':<20} {'Working Item':<30} {'Hours':<8}",
+            separator,
+        ]
         
-        for item in self.work_items:
-            date_str = item['date'].strftime('%Y-%m-%d')
-            hours_col = item.get('hours_display', f"{item['hours']:.2f}")
-            print(f"{date_str:<12} {item['topic']:<20} {item['working_item']:<30} {hours_col:<8}")
+        # Walk the columns directly rather than materializing the item dicts
+        for item_date, topic, working_item, hours, hours_display in zip(
+            self._dates, self._topics, self._working_items, self._hours, self._hours_displays
+        ):
+            date_str = item_date.strftime('%Y-%m-%d')
+            hours_col = hours_display if hours_display is not None else f"{hours:.2f}"
+            lines.append(f"{date_str:<12} {topic:<20} {working_item:<30} {hours_col:<8}")
         
-        print("-" * 80)
+        lines.append(separator)
+        print("\n".join(lines))
     
     def compute_total_hours(self) -> float:
         """
         Compute the sum of hours worked for all items.
         
+        The sum is taken once by retrieve_work_items().
+        
         Returns:
             float: Total hours worked
         """
-        return sum(item['hours'] for item in self.work_items)
+        return self._total_hours
     
     def get_work_items(self) -> List[Dict]:
         """
@@ -367,13 +606,14 @@ class GoogleDocReader:
             raise ValueError("Not connected to sheet. Call connect() first.")
         
         try:
-            # Read currency from cell E1 (row 1, column 5 in 1-based indexing)
-            currency = self._sheet.cell(1, 5).value  # E1
+            # Currency (E1) and hourly rate (E2) come from the same fetch as the work items
+            all_values = self._get_all_values()
+            cells = [row[4] if len(row) > 4 else '' for row in all_values[:2]] + ['', '']
+            currency, hourly_rate_str = cells[0], cells[1]
+            
             if not currency:
                 raise ValueError("Cell E1 (currency) is empty in Google Sheet!")
             
-            # Read hourly rate from cell E2 (row 2, column 5 in 1-based indexing)
-            hourly_rate_str = self._sheet.cell(2, 5).value  # E2
             if not hourly_rate_str:
                 raise ValueError("Cell E2 (hourly rate) is empty in Google Sheet!")
             
@@ -386,3 +626,16 @@ class GoogleDocReader:
             
         except Exception as e:
             raise ValueError(f"Error reading currency and hourly rate from Google Sheet: {e}")
+
+
+async def gather_readers(readers: List[GoogleDocReader]) -> List[List[Dict]]:
+    """
+    Retrieve work items for several connected readers concurrently.
+    
+    Args:
+        readers (List[GoogleDocReader]): Readers on which connect() succeeded
+        
+    Returns:
+        List[List[Dict]]: Work items per reader, in the order of readers
+    """
+    return list(await asyncio.gather(*(reader.retrieve_work_items_async() for reader in readers)))
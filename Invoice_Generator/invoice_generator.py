@@ -7,39 +7,56 @@ Processes invoice template Word documents by replacing placeholders with current
 import os
 import sys
 import json
+import logging
 import argparse
 from datetime import date, datetime, timedelta
 import calendar
 from decimal import Decimal, ROUND_HALF_UP
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from word_document_editor import WordDocumentEditor
 from google_doc_reader import GoogleDocReader
 from earnings_sheet_writer import EarningsSheetWriter
 
 
+_CENT = Decimal('0.01')
+
+
 def _round_up_half(value, decimals=2):
     """Round value to specified decimal places, rounding 0.5 up."""
+    # Decimal(str(value)) rounds the printed amount, not its binary float approximation
     decimal_value = Decimal(str(value))
-    return float(decimal_value.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP))
+    return float(decimal_value.quantize(_CENT, rounding=ROUND_HALF_UP))
 
 
-def create_invoice_folder(invoice_folder_base, last_month_date):
-    """Create folder with format YYYY-MM-DD <last month name> <last month year>"""
-    folder_name = f"{last_month_date.strftime('%Y-%m-%d')} {last_month_date.strftime('%B %Y')}"
+def create_invoice_folder(invoice_folder_base, folder_name):
+    """Create the invoice folder <invoice_folder_base>/<folder_name> if it does not exist yet"""
     folder_path = os.path.join(invoice_folder_base, folder_name)
     
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
-        print(f"Created folder: {folder_path}")
+    existed = os.path.isdir(folder_path)
+    os.makedirs(folder_path, exist_ok=True)
+    if existed:
+        print(f"Using existing invoice folder: {folder_path}")
     else:
-        print(f"Folder already exists: {folder_path}")
+        print(f"Created invoice folder: {folder_path}")
     
     return folder_path
 
 def load_config(config_path):
     """Load configuration from JSON file"""
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        # orjson is faster when installed; its JSONDecodeError subclasses json's
+        if orjson is not None:
+            with open(config_path, 'rb') as f:
+                config = orjson.loads(f.read())
+        else:
+            with open(config_path, 'r') as f:
+                config = json.load(f)
         return config
     except FileNotFoundError:
         print(f"Error: Config file '{config_path}' not found!")
@@ -48,79 +65,124 @@ def load_config(config_path):
         print(f"Error: Invalid JSON in config file: {e}")
         sys.exit(1)
 
-def process_google_sheets_data(editor, config):
+def validate_environment(config):
     """
-    Process Google Sheets data and add working items to the Word document.
+    Validate the environment and the required config items before any work is done.
+    
+    Reports every missing item, then exits if there was any.
     
     Args:
-        editor (WordDocumentEditor): The Word document editor instance
         config (dict): Configuration dictionary
         
     Returns:
-        bool: True if processing was successful, False otherwise
+        argparse.Namespace: google_doc_link, sheet_name, vat_enabled, template_path
+        and invoice_folder_base
     """
-    # Get Google Sheets configuration
-    google_doc_link = os.getenv('GOOGLE_DOC_LINK')
-    sheet_name = config.get('GSheet')
+    settings = argparse.Namespace(
+        google_doc_link=os.getenv('GOOGLE_DOC_LINK'),
+        sheet_name=config.get('GSheet'),
+        vat_enabled=config.get('VAT'),
+        template_path=config.get('template'),
+        invoice_folder_base=config.get('invoice_folder'),
+    )
     
-    if not google_doc_link:
-        print("Error: GOOGLE_DOC_LINK environment variable not set")
-        print("Google Sheets integration is required for invoice generation")
-        sys.exit(1)
+    errors = []
+    if not settings.template_path:
+        errors.append("Error: 'template' not found in config file!")
+    if not settings.invoice_folder_base:
+        errors.append("Error: 'invoice_folder' not found in config file!")
+    if not settings.google_doc_link:
+        errors.append("Error: GOOGLE_DOC_LINK environment variable not set")
+    if not settings.sheet_name:
+        errors.append("Error: 'GSheet' not found in config file")
+    if settings.vat_enabled is None:
+        errors.append("Error: 'VAT' configuration item is missing from config file!")
     
-    if not sheet_name:
-        print("Error: 'GSheet' not found in config file")
-        print("Google Sheets integration is required for invoice generation")
+    if errors:
+        for error in errors:
+            print(error)
+        if not (settings.google_doc_link and settings.sheet_name):
+            print("Google Sheets integration is required for invoice generation")
         sys.exit(1)
     
+    return settings
+
+def resolve_period(config):
+    """
+    Resolve the invoicing period from the config.
+    
+    Uses period_from/period_to when both are set (a period within a single
+    month is extended to the last day of that month), otherwise the previous
+    calendar month. Exits on invalid dates.
+    
+    Args:
+        config (dict): Configuration dictionary
+        
+    Returns:
+        tuple: (period_from: date, period_to: date, is_custom: bool)
+    """
+    period_from_str = config.get('period_from')
+    period_to_str = config.get('period_to')
+    
+    if period_from_str and period_to_str:
+        try:
+            period_from = WordDocumentEditor.validate_date_format(period_from_str).date()
+            period_to = WordDocumentEditor.validate_date_format(period_to_str).date()
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        
+        # Validate that period_from is before period_to
+        if period_from > period_to:
+            print(f"Error: period_from ({period_from_str}) must be before period_to ({period_to_str})")
+            sys.exit(1)
+        
+        # If same year-month and period_to is the first (or equal to from), extend to last day of that month
+        if period_from.year == period_to.year and period_from.month == period_to.month:
+            last_day = calendar.monthrange(period_from.year, period_from.month)[1]
+            period_to = period_to.replace(day=last_day)
+        
+        return (period_from, period_to, True)
+    
+    # Default behavior: use previous month
+    last_month_date = WordDocumentEditor.get_last_month_date()
+    period_from = date(last_month_date.year, last_month_date.month, 1)
+    # Compute last day of that month
+    last_day = calendar.monthrange(period_from.year, period_from.month)[1]
+    period_to = date(period_from.year, period_from.month, last_day)
+    return (period_from, period_to, False)
+
+def process_google_sheets_data(editor, settings, period):
+    """
+    Process Google Sheets data and add working items to the Word document.
+    
+    Args:
+        editor (WordDocumentEditor): The Word document editor instance
+        settings (argparse.Namespace): Validated settings from validate_environment()
+        period (tuple): (period_from, period_to, is_custom) from resolve_period()
+        
+    Returns:
+        tuple: (total_hours, currency, hourly_rate, client) where client is the
+               authenticated gspread client, reusable for further Sheets access
+    """
+    # Get Google Sheets configuration
+    google_doc_link = settings.google_doc_link
+    sheet_name = settings.sheet_name
+    
     print(f"\nProcessing Google Sheets data...")
     print(f"Google Sheet: {google_doc_link}")
     print(f"Sheet name: {sheet_name}")
     
     try:
-        # Check for custom period configuration
-        period_from_str = config.get('period_from')
-        period_to_str = config.get('period_to')
+        period_from, period_to, is_custom_period = period
         
-        if period_from_str and period_to_str:
-            # Custom period specified
+        if is_custom_period:
             print("Custom period specified in config")
-            try:
-                period_from = WordDocumentEditor.validate_date_format(period_from_str)
-                period_to = WordDocumentEditor.validate_date_format(period_to_str)
-                
-                # Validate that period_from is before period_to
-                if period_from > period_to:
-                    print(f"Error: period_from ({period_from_str}) must be before period_to ({period_to_str})")
-                    sys.exit(1)
-
-                # If same year-month and period_to is the first (or equal to from), extend to last day of that month
-                if period_from.year == period_to.year and period_from.month == period_to.month:
-                    last_day = calendar.monthrange(period_from.year, period_from.month)[1]
-                    period_to = period_to.replace(day=last_day)
-                
-                print(f"Looking for work items from: {period_from.strftime('%Y-%m-%d')} to {period_to.strftime('%Y-%m-%d')}")
-                
-                # Create GoogleDocReader instance with custom period
-                reader = GoogleDocReader(google_doc_link, sheet_name, period_from.date(), period_to.date())
-                
-            except ValueError as e:
-                print(f"Error: {e}")
-                sys.exit(1)
         else:
-            # Default behavior: use previous month
-            last_month_date = WordDocumentEditor.get_last_month_date()
-            target_month = date(last_month_date.year, last_month_date.month, 1)
-            # Compute last day of that month
-            last_day = calendar.monthrange(target_month.year, target_month.month)[1]
-            period_from = target_month
-            period_to = date(target_month.year, target_month.month, last_day)
-            
-            print(f"Target month: {target_month.strftime('%B %Y')}")
-            print(f"Looking for work items from: {period_from.strftime('%Y-%m-%d')} to {period_to.strftime('%Y-%m-%d')}")
-            
-            # Create GoogleDocReader instance with single month
-            reader = GoogleDocReader(google_doc_link, sheet_name, period_from, period_to)
+            print(f"Target month: {period_from.strftime('%B %Y')}")
+        print(f"Looking for work items from: {period_from.strftime('%Y-%m-%d')} to {period_to.strftime('%Y-%m-%d')}")
+        
+        reader = GoogleDocReader(google_doc_link, sheet_name, period_from, period_to)
         
         # Connect to the sheet
         print("Connecting to Google Sheet...")
@@ -129,9 +191,13 @@ def process_google_sheets_data(editor, config):
             print("Please check your Google Sheets URL and authentication")
             sys.exit(1)
         
-        # Retrieve work items
-        print("Retrieving work items...")
-        work_items = reader.retrieve_work_items()
+        # Retrieve work items, currency and hourly rate in one request
+        print("Retrieving work items, currency and hourly rate...")
+        try:
+            work_items, currency, hourly_rate = reader.fetch_sheet_data()
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
         
         if not work_items:
             print("Error: No work items found for the specified period")
@@ -153,20 +219,22 @@ def process_google_sheets_data(editor, config):
                 print("Cannot continue with invoice generation")
                 sys.exit(1)
         
-        # Add each working item to the table
+        # Add all working items to the table
         print("Adding working items to the table...")
-        for i, item in enumerate(work_items):
-            success = editor.add_working_item_to_first_free_row(
-                date=item['date'].strftime('%Y-%m-%d'),
-                topic=item['topic'],
-                efforts=item['working_item'],
-                hours=item['hours'],
-                hours_display=item.get('hours_display'),
-            )
-            if not success:
-                print(f"Error: Failed to add item {i+1}: {item['topic']}")
-                print("Cannot continue with invoice generation")
-                sys.exit(1)
+        entries = [
+            {
+                'date': item['date'].strftime('%Y-%m-%d'),
+                'topic': item['topic'],
+                'efforts': item['working_item'],
+                'hours': item['hours'],
+                'hours_display': item.get('hours_display'),
+            }
+            for item in work_items
+        ]
+        if not editor.fill_working_items(entries):
+            print("Error: Failed to add working items to the table")
+            print("Cannot continue with invoice generation")
+            sys.exit(1)
         
         # Calculate total hours from all work items
         total_hours = reader.compute_total_hours()
@@ -191,37 +259,30 @@ def process_google_sheets_data(editor, config):
         print(f"- Added {len(work_items)} working items")
         print(f"- Total hours: {total_hours:.2f}")
         
-        # Read currency and hourly rate from Google Sheet
-        print("Reading currency and hourly rate from Google Sheet...")
-        try:
-            currency, hourly_rate = reader.read_currency_and_hourly_rate()
-            print(f"Currency from Google Sheet: {currency}")
-            print(f"Hourly rate from Google Sheet: {hourly_rate}")
-            
-            # Check if hourly rate is 0 - this is a critical error
-            if hourly_rate == 0.0:
-                print("ERROR: Hourly rate is 0.0 - this is a critical error!")
-                print("Please check cell E2 in your Google Sheet and ensure it contains a valid hourly rate.")
-                sys.exit(1)
-            
-        except ValueError as e:
-            print(f"Error: {e}")
+        # Currency and hourly rate were read together with the work items
+        print(f"Currency from Google Sheet: {currency}")
+        print(f"Hourly rate from Google Sheet: {hourly_rate}")
+        
+        # Check if hourly rate is 0 - this is a critical error
+        if hourly_rate == 0.0:
+            print("ERROR: Hourly rate is 0.0 - this is a critical error!")
+            print("Please check cell E2 in your Google Sheet and ensure it contains a valid hourly rate.")
             sys.exit(1)
         
-        return (total_hours, currency, hourly_rate)
+        return (total_hours, currency, hourly_rate, reader.client)
         
     except Exception as e:
         print(f"Error processing Google Sheets data: {e}")
         print("Cannot continue with invoice generation")
         sys.exit(1)
 
-def process_hourly_rate_and_vat(editor, config, total_hours, currency, hourly_rate):
+def process_hourly_rate_and_vat(editor, vat_enabled, total_hours, currency, hourly_rate):
     """
     Process hourly rate and VAT calculations, then replace placeholders.
 
     Args:
         editor (WordDocumentEditor): The Word document editor instance
-        config (dict): Configuration dictionary
+        vat_enabled (bool): Whether 8.1% VAT is added, from the 'VAT' config item
         total_hours (float): Total hours from Google Sheets
         currency (str): Currency from Google Sheets
         hourly_rate (float): Hourly rate from Google Sheets
@@ -237,19 +298,9 @@ def process_hourly_rate_and_vat(editor, config, total_hours, currency, hourly_ra
         print(f"Hourly rate: {hourly_rate}")
         print(f"Total hours: {total_hours}")
 
-        # Check VAT configuration
-        vat_enabled = config.get('VAT')
-        if vat_enabled is None:
-            print("Error: 'VAT' configuration item is missing from config file!")
-            sys.exit(1)
-
         # Calculate base amount
         base_amount = total_hours * hourly_rate
 
-        # Replace [TOTAL_HOURS] placeholder
-        total_hours_replacements = editor.find_and_replace_text("[TOTAL_HOURS]", str(total_hours))
-        print(f"Replaced [TOTAL_HOURS] with: {total_hours} ({total_hours_replacements} replacements)")
-
         if vat_enabled:
             print("VAT is enabled - calculating with 8.1% VAT")
 
@@ -265,14 +316,18 @@ def process_hourly_rate_and_vat(editor, config, total_hours, currency, hourly_ra
             money_no_vat_formatted = f"{currency} {money_no_vat:,.2f}"
             money_total_formatted = f"{currency} {money_total:,.2f}"
 
-            # Replace placeholders
-            vat_replacements = editor.find_and_replace_text("[VAT]", vat_formatted)
-            money_no_vat_replacements = editor.find_and_replace_text("[MONEY_NO_VAT]", money_no_vat_formatted)
-            money_total_replacements = editor.find_and_replace_text("[MONEY_TOTAL]", money_total_formatted)
+            # Replace placeholders in a single pass over the document
+            counts = editor.find_and_replace_all({
+                "[TOTAL_HOURS]": str(total_hours),
+                "[VAT]": vat_formatted,
+                "[MONEY_NO_VAT]": money_no_vat_formatted,
+                "[MONEY_TOTAL]": money_total_formatted,
+            })
 
-            print(f"Replaced [VAT] with: {vat_formatted} ({vat_replacements} replacements)")
-            print(f"Replaced [MONEY_NO_VAT] with: {money_no_vat_formatted} ({money_no_vat_replacements} replacements)")
-            print(f"Replaced [MONEY_TOTAL] with: {money_total_formatted} ({money_total_replacements} replacements)")
+            print(f"Replaced [TOTAL_HOURS] with: {total_hours} ({counts['[TOTAL_HOURS]']} replacements)")
+            print(f"Replaced [VAT] with: {vat_formatted} ({counts['[VAT]']} replacements)")
+            print(f"Replaced [MONEY_NO_VAT] with: {money_no_vat_formatted} ({counts['[MONEY_NO_VAT]']} replacements)")
+            print(f"Replaced [MONEY_TOTAL] with: {money_total_formatted} ({counts['[MONEY_TOTAL]']} replacements)")
 
             amounts = {"money_no_vat": money_no_vat, "vat_amount": vat_amount, "money_total": money_total}
         else:
@@ -284,10 +339,14 @@ def process_hourly_rate_and_vat(editor, config, total_hours, currency, hourly_ra
 
             money_total_formatted = f"{currency} {money_total:,.2f}"
 
-            # Replace placeholder
-            money_total_replacements = editor.find_and_replace_text("[MONEY_TOTAL]", money_total_formatted)
+            # Replace placeholders in a single pass over the document
+            counts = editor.find_and_replace_all({
+                "[TOTAL_HOURS]": str(total_hours),
+                "[MONEY_TOTAL]": money_total_formatted,
+            })
 
-            print(f"Replaced [MONEY_TOTAL] with: {money_total_formatted} ({money_total_replacements} replacements)")
+            print(f"Replaced [TOTAL_HOURS] with: {total_hours} ({counts['[TOTAL_HOURS]']} replacements)")
+            print(f"Replaced [MONEY_TOTAL] with: {money_total_formatted} ({counts['[MONEY_TOTAL]']} replacements)")
 
             amounts = {"money_no_vat": money_no_vat, "vat_amount": vat_amount, "money_total": money_total}
 
@@ -297,25 +356,109 @@ def process_hourly_rate_and_vat(editor, config, total_hours, currency, hourly_ra
         print(f"Error processing hourly rate and VAT: {e}")
         return (False, None)
 
+def build_output_paths(editor, invoice_folder_base, last_month_formatted, now,
+                       alternative_invoice_date=None, custom_period_from=None, custom_period_to=None):
+    """
+    Create the invoice folder and build the output file name and path.
+    
+    Args:
+        editor (WordDocumentEditor): The Word document editor instance
+        invoice_folder_base (str): Base folder for invoices
+        last_month_formatted (str): Text used for [LAST_MONTH] (last month or custom period)
+        now (datetime): Clock reading of this run
+        alternative_invoice_date (datetime, optional): Invoice date to use instead of today
+        custom_period_from (date, optional): Custom period start date
+        custom_period_to (date, optional): Custom period end date
+        
+    Returns:
+        tuple: (invoice_folder, output_filename, output_path)
+    """
+    today = alternative_invoice_date or now
+    if custom_period_from and custom_period_to:
+        # Use custom period for folder naming (always dated with the current date)
+        folder_name = WordDocumentEditor.format_period_folder_name(custom_period_from, custom_period_to, now)
+    else:
+        # Use the invoice date and last month name (not last day of previous month)
+        last_month_date = WordDocumentEditor.get_last_month_date(now)
+        folder_name = f"{today.strftime('%Y-%m-%d')} {last_month_date.strftime('%B %Y')}"
+    invoice_folder = create_invoice_folder(invoice_folder_base, folder_name)
+    
+    output_filename = editor.generate_output_filename(last_month_formatted, today)
+    return (invoice_folder, output_filename, os.path.join(invoice_folder, output_filename))
+
+def convert_and_copy_pdf(editor, output_path, invoice_folder, copy_to_folder):
+    """
+    Convert the saved invoice to PDF and copy the PDF to the configured folder.
+    
+    Args:
+        editor (WordDocumentEditor): The Word document editor instance
+        output_path (str): Path of the saved Word document
+        invoice_folder (str): Folder the invoice was saved to
+        copy_to_folder (str or None): Base folder to copy the PDF to, if any
+        
+    Returns:
+        bool: True if the PDF was created, False otherwise
+    """
+    # Convert Word document to PDF
+    print("\n" + "="*50)
+    print("Converting to PDF...")
+    if not editor.convert_to_pdf(output_path):
+        print("Warning: PDF conversion failed, but Word document was saved successfully")
+        return False
+    
+    print("PDF conversion completed successfully!")
+    
+    # Copy PDF to specified folder
+    if copy_to_folder:
+        print("\n" + "="*50)
+        print("Copying PDF to specified folder...")
+        
+        # Get the output folder name (last part of the path)
+        output_folder_name = os.path.basename(invoice_folder.rstrip('/'))
+        pdf_path = os.path.splitext(output_path)[0] + '.pdf'
+        
+        if editor.copy_pdf_to_folder(pdf_path, copy_to_folder, output_folder_name):
+            print("PDF copy completed successfully!")
+        else:
+            print("Warning: PDF copy failed, but PDF was created successfully")
+    else:
+        print("No copy folder specified in config, skipping PDF copy")
+    
+    return True
+
 def main():
     parser = argparse.ArgumentParser(description='Generate invoice from template')
     parser.add_argument('--config', help='Path to configuration JSON file')
     args = parser.parse_args()
     
+    # Show library progress messages alongside the script's own output
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     # Load configuration
     config = load_config(args.config)
     
-    # Get template path from config
-    template_path = config.get('template')
-    if not template_path:
-        print("Error: 'template' not found in config file!")
-        sys.exit(1)
+    # Validate environment and config before any document or Sheets work
+    settings = validate_environment(config)
+    template_path = settings.template_path
+    invoice_folder_base = settings.invoice_folder_base
     
-    # Get invoice folder from config
-    invoice_folder_base = config.get('invoice_folder')
-    if not invoice_folder_base:
-        print("Error: 'invoice_folder' not found in config file!")
-        sys.exit(1)
+    # Resolve the period before the template is loaded, so a bad config fails fast;
+    # the custom bounds are also used for placeholder replacement
+    period = resolve_period(config)
+    period_from, period_to, is_custom_period = period
+    custom_period_from = period_from if is_custom_period else None
+    custom_period_to = period_to if is_custom_period else None
+    
+    # Check for alternative invoice date
+    alternative_invoice_date_str = config.get('alternative_inovoice_date')
+    alternative_invoice_date = None
+    if alternative_invoice_date_str:
+        try:
+            alternative_invoice_date = WordDocumentEditor.validate_date_format(alternative_invoice_date_str)
+            print(f"Using alternative invoice date: {alternative_invoice_date.strftime('%B %d, %Y')}")
+        except ValueError as e:
+            print(f"Error: Invalid alternative_inovoice_date format: {e}")
+            sys.exit(1)
     
     try:
         # Initialize Word Document Editor
@@ -332,47 +475,32 @@ def main():
         doc_info = editor.get_document_info()
         print(f"Document loaded: {doc_info['paragraphs_count']} paragraphs, {doc_info['tables_count']} tables")
         
-        # Check for custom period configuration for placeholder replacement
-        period_from_str = config.get('period_from')
-        period_to_str = config.get('period_to')
-        custom_period_from = None
-        custom_period_to = None
-        
-        if period_from_str and period_to_str:
-            try:
-                custom_period_from = WordDocumentEditor.validate_date_format(period_from_str)
-                custom_period_to = WordDocumentEditor.validate_date_format(period_to_str)
-            except ValueError as e:
-                print(f"Error: {e}")
-                sys.exit(1)
+        # Check the amount placeholders before spending time on Google Sheets
+        required_placeholders = ["[TOTAL_HOURS]", "[MONEY_TOTAL]", "[RATE]"]
+        if settings.vat_enabled:
+            required_placeholders += ["[VAT]", "[MONEY_NO_VAT]"]
+        missing = editor.missing_placeholders(required_placeholders)
+        if missing:
+            print(f"Error: Template is missing required placeholders: {', '.join(missing)}")
+            sys.exit(1)
         
-        # Check for alternative invoice date
-        alternative_invoice_date_str = config.get('alternative_inovoice_date')
-        alternative_invoice_date = None
-        if alternative_invoice_date_str:
-            try:
-                alternative_invoice_date = WordDocumentEditor.validate_date_format(alternative_invoice_date_str)
-                print(f"Using alternative invoice date: {alternative_invoice_date.strftime('%B %d, %Y')}")
-            except ValueError as e:
-                print(f"Error: Invalid alternative_inovoice_date format: {e}")
-                sys.exit(1)
+        # Format the dates once from a single clock reading, so the document,
+        # folder and file names agree even if the run spans midnight
+        now = datetime.now()
+        today_formatted = WordDocumentEditor.get_today_formatted(alternative_invoice_date or now)
+        if custom_period_from and custom_period_to:
+            last_month_formatted = WordDocumentEditor.format_period_display(custom_period_from, custom_period_to)
+        else:
+            last_month_formatted = WordDocumentEditor.get_last_month_formatted(now)
+        pay_by_date_formatted = WordDocumentEditor.get_pay_by_date_formatted(now)
         
         # Replace date placeholders
         print("Replacing date placeholders...")
-        replacements = editor.replace_date_placeholders(custom_period_from, custom_period_to, alternative_invoice_date)
+        replacements = editor.replace_date_placeholders(today_formatted, last_month_formatted, pay_by_date_formatted)
         
-        # Display what was replaced for [TODAY]
-        if alternative_invoice_date:
-            today_display = alternative_invoice_date.strftime("%B %d, %Y")
-        else:
-            today_display = WordDocumentEditor.get_today_formatted()
-        print(f"Replaced [TODAY] with: {today_display} ({replacements['TODAY']} replacements)")
-        if custom_period_from and custom_period_to:
-            period_display = WordDocumentEditor.format_period_display(custom_period_from, custom_period_to)
-            print(f"Replaced [LAST_MONTH] with: {period_display} ({replacements['LAST_MONTH']} replacements)")
-        else:
-            print(f"Replaced [LAST_MONTH] with: {WordDocumentEditor.get_last_month_formatted()} ({replacements['LAST_MONTH']} replacements)")
-        print(f"Replaced [PAY_BY_DATE] with: {WordDocumentEditor.get_pay_by_date_formatted()} ({replacements['PAY_BY_DATE']} replacements)")
+        print(f"Replaced [TODAY] with: {today_formatted} ({replacements['TODAY']} replacements)")
+        print(f"Replaced [LAST_MONTH] with: {last_month_formatted} ({replacements['LAST_MONTH']} replacements)")
+        print(f"Replaced [PAY_BY_DATE] with: {pay_by_date_formatted} ({replacements['PAY_BY_DATE']} replacements)")
         
         if replacements['total'] == 0:
             print("WARNING: No placeholders were found and replaced in the document!")
@@ -380,7 +508,7 @@ def main():
         
         # Process Google Sheets data and add working items to the table
         print("\n" + "="*50)
-        total_hours, currency, hourly_rate = process_google_sheets_data(editor, config)
+        total_hours, currency, hourly_rate, sheets_client = process_google_sheets_data(editor, settings, period)
         
         # Replace [RATE] placeholder with hourly rate and currency
         print("Replacing [RATE] placeholder...")
@@ -389,7 +517,7 @@ def main():
         
         # Process hourly rate and VAT calculations
         print("\n" + "="*50)
-        vat_success, amounts = process_hourly_rate_and_vat(editor, config, total_hours, currency, hourly_rate)
+        vat_success, amounts = process_hourly_rate_and_vat(editor, settings.vat_enabled, total_hours, currency, hourly_rate)
         if not vat_success:
             print("Error: Failed to process hourly rate and VAT calculations!")
             sys.exit(1)
@@ -400,85 +528,20 @@ def main():
             print("Warning: Failed to format payment instruction")
             print("Continuing with invoice generation...")
         
-        # Create invoice folder
-        if custom_period_from and custom_period_to:
-            # Use custom period for folder naming
-            folder_name = WordDocumentEditor.format_period_folder_name(custom_period_from, custom_period_to)
-            invoice_folder = os.path.join(invoice_folder_base, folder_name)
-            if not os.path.exists(invoice_folder):
-                os.makedirs(invoice_folder)
-                print(f"Created invoice folder: {invoice_folder}")
-            else:
-                print(f"Using existing invoice folder: {invoice_folder}")
-            
-            # Generate output filename with custom period
-            period_display = WordDocumentEditor.format_period_display(custom_period_from, custom_period_to)
-            output_filename = editor.generate_output_filename(period_display, alternative_invoice_date)
-        else:
-            # Use default last month for folder naming
-            # For default behavior, use current date for folder naming (not last day of previous month)
-            # Use alternative invoice date if provided, otherwise use today
-            if alternative_invoice_date:
-                today = alternative_invoice_date
-            else:
-                today = datetime.now()
-            last_month_date = WordDocumentEditor.get_last_month_date()
-            
-            # Create folder name with current date and last month name
-            folder_name = f"{today.strftime('%Y-%m-%d')} {last_month_date.strftime('%B %Y')}"
-            invoice_folder = os.path.join(invoice_folder_base, folder_name)
-            if not os.path.exists(invoice_folder):
-                os.makedirs(invoice_folder)
-                print(f"Created invoice folder: {invoice_folder}")
-            else:
-                print(f"Using existing invoice folder: {invoice_folder}")
-            
-            # Generate output filename with default last month
-            last_month_formatted = WordDocumentEditor.get_last_month_formatted()
-            output_filename = editor.generate_output_filename(last_month_formatted, alternative_invoice_date)
-        output_path = os.path.join(invoice_folder, output_filename)
+        # Create invoice folder and build the output path
+        invoice_folder, output_filename, output_path = build_output_paths(
+            editor, invoice_folder_base, last_month_formatted, now,
+            alternative_invoice_date, custom_period_from, custom_period_to
+        )
         
         # Save the document
         print(f"Saving document as '{output_path}'...")
         if editor.save_document(output_path):
             print("Invoice generated successfully!")
             
-            # Convert Word document to PDF
-            print("\n" + "="*50)
-            print("Converting to PDF...")
-            if editor.convert_to_pdf(output_path):
-                print("PDF conversion completed successfully!")
-                
-                # Copy PDF to specified folder
-                copy_to_folder = config.get('copy_invoice_PDF_to_folder')
-                if copy_to_folder:
-                    print("\n" + "="*50)
-                    print("Copying PDF to specified folder...")
-                    
-                    # Get the output folder name (last part of the path)
-                    output_folder_name = os.path.basename(invoice_folder.rstrip('/'))
-                    pdf_path = output_path.replace('.docx', '.pdf')
-                    
-                    if editor.copy_pdf_to_folder(pdf_path, copy_to_folder, output_folder_name):
-                        print("PDF copy completed successfully!")
-                    else:
-                        print("Warning: PDF copy failed, but PDF was created successfully")
-                else:
-                    print("No copy folder specified in config, skipping PDF copy")
-            else:
-                print("Warning: PDF conversion failed, but Word document was saved successfully")
-
             # Optional: add row to overall earnings list
-            last_month_str = (
-                WordDocumentEditor.format_period_display(custom_period_from, custom_period_to)
-                if (custom_period_from and custom_period_to)
-                else WordDocumentEditor.get_last_month_formatted()
-            )
-            today_date = (
-                alternative_invoice_date.date()
-                if alternative_invoice_date
-                else date.today()
-            )
+            last_month_str = last_month_formatted
+            today_date = (alternative_invoice_date or now).date()
             pay_by_date = today_date + timedelta(days=30)
             today_yyyymmdd = today_date.strftime("%Y-%m-%d")
             pay_by_yyyymmdd = pay_by_date.strftime("%Y-%m-%d")
@@ -491,13 +554,27 @@ def main():
                 currency=currency,
                 today_yyyymmdd=today_yyyymmdd,
                 pay_by_yyyymmdd=pay_by_yyyymmdd,
+                gc=sheets_client,
             )
-            writer.run()
+            # Ask before the PDF work starts, so its messages cannot bury the prompt
+            add_earnings_row = writer.confirm()
+
+            # Convert to PDF (and copy it) in the background while the earnings row is written
+            with ThreadPoolExecutor(max_workers=1) as pdf_executor:
+                pdf_future = pdf_executor.submit(
+                    convert_and_copy_pdf, editor, output_path, invoice_folder,
+                    config.get('copy_invoice_PDF_to_folder')
+                )
+                try:
+                    writer.run(confirmed=add_earnings_row)
+                finally:
+                    # Wait for the PDF (and surface its errors) before printing the email
+                    pdf_future.result()
 
             # Compose and print email for copy/paste
             email_contact_names = config.get("email_contact_names", "Sir/Madam").strip() or "Sir/Madam"
             if custom_period_from and custom_period_to:
-                invoice_period = "the period " + WordDocumentEditor.format_period_display(custom_period_from, custom_period_to)
+                invoice_period = "the period " + last_month_formatted
             else:
                 invoice_period = last_month_str
             email_body = f"""
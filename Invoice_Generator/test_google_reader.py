@@ -5,12 +5,17 @@ Reads Google Doc link from environment variable and tests the reader functionali
 """
 
 import os
+import sys
+import logging
 from datetime import date
 from google_doc_reader import GoogleDocReader
 
 def main():
     """Test the GoogleDocReader functionality."""
     
+    # Show the reader's progress messages
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     # Get Google Doc link from environment variable
     google_doc_link = os.getenv('GOOGLE_DOC_LINK')
     
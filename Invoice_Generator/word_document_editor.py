@@ -4,14 +4,125 @@ Word Document Editor Class
 Handles Word document template processing, placeholder replacement, and document manipulation.
 """
 
+import errno
+import io
+import logging
 import os
+import re
 import shutil
+from bisect import bisect_right
+from itertools import accumulate, repeat
 import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property
 from docx import Document
 from docx.shared import RGBColor, Pt
 from docx.enum.text import WD_COLOR_INDEX, WD_ALIGN_PARAGRAPH
-from typing import Dict, List, Optional
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, nsmap, qn
+from docx.text.paragraph import Paragraph
+from lxml import etree
+from xml.sax.saxutils import escape
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Template placeholders look like [TODAY], [LAST_MONTH], [MONEY_TOTAL], ...
+_PLACEHOLDER_RE = re.compile(r'\[[A-Z_]+\]')
+
+# Payment instruction line: contains all three phrases, in any order and any case
+_PAYMENT_INSTRUCTION_RE = re.compile(
+    r'(?=.*please transfer)(?=.*bank account)(?=.*at latest)',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Validation checks on the document body, compiled once
+_XP_HAS_CONTENT = etree.XPath('boolean(./w:p | ./w:tbl)', namespaces={'w': nsmap['w']})
+# Very long paragraphs might indicate corruption; the length is measured without building the text
+_XP_LONG_PARAGRAPH = etree.XPath('boolean(./w:p[string-length(.) > 10000])', namespaces={'w': nsmap['w']})
+
+# LibreOffice commands to try for PDF conversion, in order
+_LIBREOFFICE_COMMANDS = [
+    'libreoffice',  # Standard command
+    'soffice',  # Binary name on PATH for some installs (e.g. Windows, Flatpak wrappers)
+    '/Applications/LibreOffice.app/Contents/MacOS/soffice',  # macOS app bundle
+    '/usr/bin/libreoffice',  # Linux/Ubuntu
+    '/usr/local/bin/libreoffice'  # Homebrew on Intel Mac
+]
+
+# Template path -> raw .docx bytes, so each template is read from disk only once per process
+_TEMPLATE_BYTES_CACHE: Dict[str, bytes] = {}
+
+# Placeholders in template filenames, see generate_output_filename()
+_FILENAME_PLACEHOLDER_RE = re.compile(r'(\[LAST_MONTH\]|\[TODAY\])')
+
+# Cell shading element, filled in with the hex color
+_SHADING_XML = f'<w:shd {nsdecls("w")} w:fill="{{fill}}"/>'
+
+# Characters that end a <w:t> text node inside a run
+_RUN_BREAK_RE = re.compile(r'([\t\r\n])')
+
+
+def _run_xml(text: str, bold: bool = False) -> str:
+    """
+    Build the XML of a <w:r> holding the given text.
+    
+    Gives the same run as python-docx's run.text setter (tabs become <w:tab/>,
+    line breaks <w:br/>), but as a string that can be parsed in one go.
+    
+    Args:
+        text (str): Text of the run
+        bold (bool): Make the run bold, like run.bold = True
+        
+    Returns:
+        str: The <w:r> element, without namespace declarations
+    """
+    content = ['<w:rPr><w:b/></w:rPr>'] if bold else []
+    for piece in _RUN_BREAK_RE.split(text):
+        if piece == '\t':
+            content.append('<w:tab/>')
+        elif piece in ('\r', '\n'):
+            content.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if len(piece.strip()) < len(piece) else ''
+            content.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    return f'<w:r>{"".join(content)}</w:r>'
+
+
+def _copy_file(src: str, dst: str):
+    """
+    Copy a file together with its metadata, like shutil.copy2().
+    
+    Where available, os.copy_file_range() lets the kernel copy the data (or share
+    it, on copy-on-write filesystems) without reading it into Python; otherwise
+    shutil.copyfile() is used.
+    
+    Args:
+        src (str): Path of the file to copy
+        dst (str): Path of the copy
+    """
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    count = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if count == 0:
+                        break
+                    remaining -= count
+            copied = remaining == 0
+        except OSError as e:
+            # Not supported by the kernel or between these filesystems
+            if e.errno not in (errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM):
+                raise
+    
+    if not copied:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
 
 class WordDocumentEditor:
     """
@@ -20,23 +131,58 @@ class WordDocumentEditor:
     Attributes:
         template_path (str): Path to the Word document template
         document (Document): The loaded Word document
+        validate_on_save (bool): Whether save_document() validates the document first
     """
     
-    def __init__(self, template_path: str):
+    # LibreOffice command found by _find_libreoffice(), shared by all editors
+    _libreoffice_cmd: Optional[str] = None
+    
+    def __init__(self, template_path: str, validate_on_save: bool = False):
         """
         Initialize the WordDocumentEditor.
         
         Args:
             template_path (str): Path to the Word document template
+            validate_on_save (bool): Validate the document before every save. Off by default,
+                documents built from a known template do not need it; see validate()
         """
         self.template_path = template_path
         self.document = None
-        self._validate_template()
+        self.validate_on_save = validate_on_save
+        self._template_filename = os.path.basename(template_path)
+        # The template filename split around its placeholders, for generate_output_filename()
+        self._template_filename_parts = _FILENAME_PLACEHOLDER_RE.split(self._template_filename)
+        # Placeholder -> paragraphs containing it, recorded when the template is loaded
+        self._placeholder_paragraphs: Optional[Dict[str, list]] = None
+        # Flattened paragraphs and first table, cached until the tables change
+        self._all_paragraphs: Optional[list] = None
+        self._first_table = None
+        # Text of the whole body, cached until the document is edited
+        self._body_text: Optional[str] = None
+        # Row to continue the free-row search from, after the row filled last
+        self._next_free_row_idx: Optional[int] = None
+        # (absolute path, .docx bytes) of the last save, so convert_to_pdf() needs no second serialization
+        self._saved_docx: Optional[Tuple[str, bytes]] = None
     
-    def _validate_template(self):
-        """Validate that the template file exists and is accessible."""
-        if not os.path.exists(self.template_path):
-            raise FileNotFoundError(f"Template file '{self.template_path}' not found!")
+    def __enter__(self) -> "WordDocumentEditor":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Release the loaded document and everything cached from it.
+        
+        Keeps memory bounded to one document at a time when many invoices are
+        generated in one process. The editor can be reused with load_document().
+        """
+        self.document = None
+        self._invalidate_cache()
+        self._placeholder_paragraphs = None
+        self._first_table = None
+        self._next_free_row_idx = None
+        self._saved_docx = None
     
     def load_document(self) -> bool:
         """
@@ -44,39 +190,56 @@ class WordDocumentEditor:
         
         Returns:
             bool: True if document loaded successfully, False otherwise
+            
+        Raises:
+            FileNotFoundError: If the template file does not exist
         """
         try:
-            self.document = Document(self.template_path)
+            data = _TEMPLATE_BYTES_CACHE.get(self.template_path)
+            if data is None:
+                # Opening the file is the existence check
+                with open(self.template_path, 'rb') as f:
+                    data = f.read()
+                _TEMPLATE_BYTES_CACHE[self.template_path] = data
+            # Every load gets its own document parsed from the cached bytes
+            self.document = Document(io.BytesIO(data))
+            self._invalidate_cache()
+            self._next_free_row_idx = None
+            self._first_table = self.document.tables[0] if self.document.tables else None
+            self._index_placeholders()
             return True
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template file '{self.template_path}' not found!") from None
         except Exception as e:
-            print(f"Error loading document: {e}")
+            logger.error("Error loading document: %s", e)
             return False
     
     @staticmethod
-    def get_today_formatted() -> str:
-        """Get today's date in MMMM dd, YYYY format"""
-        return datetime.now().strftime("%B %d, %Y")
+    def get_today_formatted(today: Optional[datetime] = None) -> str:
+        """Get today's date (or the given date) in MMMM dd, YYYY format"""
+        today = today or datetime.now()
+        return today.strftime("%B %d, %Y")
     
     @staticmethod
-    def get_last_month_formatted() -> str:
-        """Get last month in MMMM YYYY format"""
-        today = datetime.now()
+    def get_last_month_formatted(today: Optional[datetime] = None) -> str:
+        """Get last month (relative to today or the given date) in MMMM YYYY format"""
+        today = today or datetime.now()
         # Get first day of current month, then subtract one day to get last month
         first_day_current = today.replace(day=1)
         last_month = first_day_current - timedelta(days=1)
         return last_month.strftime("%B %Y")
     
     @staticmethod
-    def get_pay_by_date_formatted() -> str:
-        """Get today + 30 days in MMMM dd, YYYY format"""
-        today = datetime.now()
+    def get_pay_by_date_formatted(today: Optional[datetime] = None) -> str:
+        """Get today (or the given date) + 30 days in MMMM dd, YYYY format"""
+        today = today or datetime.now()
         pay_by_date = today + timedelta(days=30)
         return pay_by_date.strftime("%B %d, %Y")
     
     @staticmethod
-    def get_last_month_date() -> datetime:
-        """Get last month date object for folder naming"""
-        today = datetime.now()
+    def get_last_month_date(today: Optional[datetime] = None) -> datetime:
+        """Get last month date object (relative to today or the given date) for folder naming"""
+        today = today or datetime.now()
         first_day_current = today.replace(day=1)
         return first_day_current - timedelta(days=1)
     
@@ -121,19 +284,20 @@ class WordDocumentEditor:
             return f"{from_month} - {to_month}"
     
     @staticmethod
-    def format_period_folder_name(period_from: datetime, period_to: datetime) -> str:
+    def format_period_folder_name(period_from: datetime, period_to: datetime, today: Optional[datetime] = None) -> str:
         """
         Format period for folder naming.
         
         Args:
             period_from (datetime): Start date of the period
             period_to (datetime): End date of the period
+            today (datetime, optional): Date to prefix the folder with, defaults to now
             
         Returns:
             str: Formatted folder name
         """
         # Use current date for folder naming
-        today = datetime.now()
+        today = today or datetime.now()
         current_date_str = today.strftime("%Y-%m-%d")
         
         # If same month, use single month format
@@ -146,55 +310,183 @@ class WordDocumentEditor:
             to_month = period_to.strftime("%B %Y")
             return f"{current_date_str} {from_month} to {to_month}"
     
-    def find_and_replace_text(self, old_text: str, new_text: str) -> int:
+    def _iter_body_paragraphs(self):
+        """Yield the paragraphs of the document body one by one, without building the whole list."""
+        body = self.document._body
+        for p in self.document.element.body.iterchildren(qn('w:p')):
+            yield Paragraph(p, body)
+    
+    def _iter_paragraphs(self):
+        """Yield all paragraphs of the document body, then those inside table cells."""
+        yield from self._iter_body_paragraphs()
+        for table in self.document.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    yield from cell.paragraphs
+    
+    def _get_all_paragraphs(self) -> list:
+        """Get all paragraphs of the document body and table cells, walking the document only once."""
+        if self._all_paragraphs is None:
+            self._all_paragraphs = list(self._iter_paragraphs())
+        return self._all_paragraphs
+    
+    def _get_first_table(self):
+        """Get the first table of the document, or None if it has no tables."""
+        if self._first_table is None and self.document.tables:
+            self._first_table = self.document.tables[0]
+        return self._first_table
+    
+    def _get_body_text(self) -> str:
+        """Get the text of all runs in the document body joined together."""
+        if self._body_text is None:
+            self._body_text = self.document.element.body.xpath('string(.)')
+        return self._body_text
+    
+    def _invalidate_cache(self):
+        """Drop the cached paragraph list, body text and document info after the document has changed."""
+        self._all_paragraphs = None
+        self._body_text = None
+        self.__dict__.pop('document_info', None)
+    
+    def _index_placeholders(self):
+        """Record, in document order, which paragraphs of the template contain which placeholders."""
+        self._placeholder_paragraphs = {}
+        seen = set()
+        for paragraph in self._get_all_paragraphs():
+            # Merged table cells yield the same paragraph more than once
+            if paragraph._p in seen:
+                continue
+            seen.add(paragraph._p)
+            for placeholder in set(_PLACEHOLDER_RE.findall(paragraph.text)):
+                self._placeholder_paragraphs.setdefault(placeholder, []).append((len(seen), paragraph))
+    
+    def _candidate_paragraphs(self, old_texts):
         """
-        Find and replace text in all paragraphs and tables.
+        Get the paragraphs that may contain any of the given texts.
         
         Args:
-            old_text (str): Text to find and replace
-            new_text (str): Text to replace with
+            old_texts: Texts to look for
             
         Returns:
-            int: Number of replacements made
+            Iterable of paragraphs: only the indexed paragraphs if every text is a
+            placeholder, otherwise all paragraphs of the document
+        """
+        if self._placeholder_paragraphs is None or not all(
+            _PLACEHOLDER_RE.fullmatch(old_text) for old_text in old_texts
+        ):
+            return self._get_all_paragraphs()
+        
+        # Placeholders missing from the index do not occur in the template at all
+        candidates = {}
+        for old_text in old_texts:
+            candidates.update(self._placeholder_paragraphs.get(old_text, ()))
+        return [candidates[order] for order in sorted(candidates)]
+    
+    def missing_placeholders(self, placeholders: List[str]) -> List[str]:
+        """
+        Check which of the given placeholders the loaded template does not contain.
+        
+        Args:
+            placeholders (List[str]): Placeholders to look for, e.g. "[RATE]"
+            
+        Returns:
+            List[str]: The placeholders that were not found, in the given order
         """
         if not self.document:
             raise ValueError("Document not loaded. Call load_document() first.")
         
-        replacements_made = 0
+        # The index built on load answers this without touching the document
+        if self._placeholder_paragraphs is not None and all(
+            _PLACEHOLDER_RE.fullmatch(placeholder) for placeholder in placeholders
+        ):
+            return [placeholder for placeholder in placeholders if placeholder not in self._placeholder_paragraphs]
         
-        # Replace in paragraphs
-        for paragraph in self.document.paragraphs:
-            if old_text in paragraph.text:
-                # Clear the paragraph and rebuild it with the replacement
-                full_text = paragraph.text
-                if old_text in full_text:
-                    paragraph.clear()
-                    paragraph.add_run(full_text.replace(old_text, new_text))
-                    replacements_made += 1
+        texts = [paragraph.text for paragraph in self._get_all_paragraphs()]
+        return [placeholder for placeholder in placeholders if not any(placeholder in text for text in texts)]
+    
+    def find_and_replace_all(self, replacements: Dict[str, str]) -> Dict[str, int]:
+        """
+        Find and replace several texts in all paragraphs and tables in a single pass.
         
-        # Replace in tables
-        for table in self.document.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for paragraph in cell.paragraphs:
-                        if old_text in paragraph.text:
-                            # Clear the paragraph and rebuild it with the replacement
-                            full_text = paragraph.text
-                            if old_text in full_text:
-                                paragraph.clear()
-                                paragraph.add_run(full_text.replace(old_text, new_text))
-                                replacements_made += 1
+        Args:
+            replacements (Dict[str, str]): Mapping of text to find to text to replace it with
+            
+        Returns:
+            Dict[str, int]: Number of paragraphs changed per text to find
+        """
+        if not self.document:
+            raise ValueError("Document not loaded. Call load_document() first.")
         
+        replacements_made = {old_text: 0 for old_text in replacements}
+        
+        # Texts that do not occur in the body text cannot be in any paragraph.
+        # The joined text, unlike the XML, still contains placeholders split over runs.
+        body_text = self._get_body_text()
+        replacements = {old_text: new_text for old_text, new_text in replacements.items() if old_text in body_text}
+        if not replacements:
+            return replacements_made
+        
+        # Longest first, so a placeholder that is a prefix of another cannot shadow it
+        pattern = re.compile('|'.join(
+            re.escape(old_text) for old_text in sorted(replacements, key=len, reverse=True)
+        ))
+        
+        for paragraph in self._candidate_paragraphs(replacements):
+            # Edit the <w:t> text nodes in place so the runs keep their formatting
+            text_nodes = paragraph._p.xpath('./w:r/w:t | ./w:hyperlink/w:r/w:t')
+            texts = [node.text or '' for node in text_nodes]
+            matches = list(pattern.finditer(''.join(texts)))
+            if not matches:
+                continue
+            
+            # Offset of each text node within the joined paragraph text
+            starts = list(accumulate(map(len, texts), initial=0))
+            
+            # Right to left, so the offsets of the remaining matches stay valid
+            for match in reversed(matches):
+                # A placeholder may be split over several runs: the replacement
+                # goes into the first one, the rest of the match is cut out
+                first = bisect_right(starts, match.start()) - 1
+                index = first
+                while index < len(texts) and starts[index] < match.end():
+                    lo = max(match.start() - starts[index], 0)
+                    hi = min(match.end() - starts[index], len(texts[index]))
+                    insert = replacements[match.group(0)] if index == first else ''
+                    texts[index] = texts[index][:lo] + insert + texts[index][hi:]
+                    index += 1
+            
+            for node, text in zip(text_nodes, texts):
+                if node.text != text:
+                    node.text = text
+                    node.set(qn('xml:space'), 'preserve')
+            
+            for old_text in {match.group(0) for match in matches}:
+                replacements_made[old_text] += 1
+        
+        self._body_text = None
         return replacements_made
     
-    def replace_date_placeholders(self, custom_period_from=None, custom_period_to=None, alternative_today_date=None) -> Dict[str, int]:
+    def find_and_replace_text(self, old_text: str, new_text: str) -> int:
+        """
+        Find and replace text in all paragraphs and tables.
+        
+        Args:
+            old_text (str): Text to find and replace
+            new_text (str): Text to replace with
+            
+        Returns:
+            int: Number of replacements made
+        """
+        return self.find_and_replace_all({old_text: new_text})[old_text]
+    
+    def replace_date_placeholders(self, today_formatted: str, last_month_formatted: str, pay_by_date_formatted: str) -> Dict[str, int]:
         """
         Replace all date placeholders in the document.
         
         Args:
-            custom_period_from (datetime, optional): Custom period start date
-            custom_period_to (datetime, optional): Custom period end date
-            alternative_today_date (datetime, optional): Alternative date to use instead of today's date
+            today_formatted (str): Text for [TODAY], e.g. "October 15, 2025"
+            last_month_formatted (str): Text for [LAST_MONTH], e.g. "September 2025" or "Jul'25 - Aug'25"
+            pay_by_date_formatted (str): Text for [PAY_BY_DATE], e.g. "November 14, 2025"
         
         Returns:
             Dict[str, int]: Dictionary with placeholder names and replacement counts
@@ -202,32 +494,18 @@ class WordDocumentEditor:
         if not self.document:
             raise ValueError("Document not loaded. Call load_document() first.")
         
-        # Get formatted dates
-        if alternative_today_date:
-            # Use alternative date formatted as "MMMM dd, YYYY"
-            today_formatted = alternative_today_date.strftime("%B %d, %Y")
-        else:
-            today_formatted = self.get_today_formatted()
-        pay_by_date_formatted = self.get_pay_by_date_formatted()
-        
-        # Handle [LAST_MONTH] placeholder
-        if custom_period_from and custom_period_to:
-            # Use custom period formatting
-            last_month_formatted = self.format_period_display(custom_period_from, custom_period_to)
-        else:
-            # Use default last month formatting
-            last_month_formatted = self.get_last_month_formatted()
-        
         # Replace placeholders
-        today_replacements = self.find_and_replace_text("[TODAY]", today_formatted)
-        last_month_replacements = self.find_and_replace_text("[LAST_MONTH]", last_month_formatted)
-        pay_by_date_replacements = self.find_and_replace_text("[PAY_BY_DATE]", pay_by_date_formatted)
+        counts = self.find_and_replace_all({
+            "[TODAY]": today_formatted,
+            "[LAST_MONTH]": last_month_formatted,
+            "[PAY_BY_DATE]": pay_by_date_formatted,
+        })
         
         return {
-            "TODAY": today_replacements,
-            "LAST_MONTH": last_month_replacements,
-            "PAY_BY_DATE": pay_by_date_replacements,
-            "total": today_replacements + last_month_replacements + pay_by_date_replacements
+            "TODAY": counts["[TODAY]"],
+            "LAST_MONTH": counts["[LAST_MONTH]"],
+            "PAY_BY_DATE": counts["[PAY_BY_DATE]"],
+            "total": sum(counts.values())
         }
     
     def replace_rate_placeholder(self, currency: str, hourly_rate: float) -> int:
@@ -267,29 +545,38 @@ class WordDocumentEditor:
             raise ValueError("Document not loaded. Call load_document() first.")
         
         # Find the table (simplified - assumes first table for now)
-        table = None
-        for t in self.document.tables:
-            table = t
-            break
+        table = self._get_first_table()
         
-        if not table:
-            print(f"Warning: Could not find table '{table_name}'")
+        if table is None:
+            logger.warning("Warning: Could not find table '%s'", table_name)
             return False
         
+        self._invalidate_cache()
+        self._next_free_row_idx = None
+        
         try:
-            # Add new entries after the header row (first row)
-            for entry in entries:
-                new_row = table.add_row()
-                new_row.cells[0].text = entry.get('date', '')
-                new_row.cells[1].text = entry.get('topic', '')
-                new_row.cells[2].text = entry.get('efforts', '')
-                new_row.cells[3].text = str(entry.get('hours', 0))
+            # Cell properties of a new row, one per grid column like table.add_row() would give
+            cell_props = [
+                f'<w:tcPr><w:tcW w:type="dxa" w:w="{grid_col.w.twips}"/></w:tcPr>' if grid_col.w is not None else ''
+                for grid_col in table._tbl.tblGrid.gridCol_lst
+            ]
+            if len(cell_props) < 4:
+                raise ValueError(f"Table has {len(cell_props)} columns, expected at least 4")
             
-            print(f"Added {len(entries)} entries to the table")
+            # Add new entries after the header row (first row), each row built and parsed as a whole
+            for entry in entries:
+                texts = [entry.get('date', ''), entry.get('topic', ''), entry.get('efforts', ''), str(entry.get('hours', 0))]
+                cells = ''.join(
+                    f'<w:tc>{props}<w:p>{_run_xml(texts[col]) if col < len(texts) else ""}</w:p></w:tc>'
+                    for col, props in enumerate(cell_props)
+                )
+                table._tbl.append(parse_xml(f'<w:tr {nsdecls("w")}>{cells}</w:tr>'))
+            
+            logger.info("Added %s entries to the table", len(entries))
             return True
             
         except Exception as e:
-            print(f"Error adding table entries: {e}")
+            logger.error("Error adding table entries: %s", e)
             return False
     
     def add_rows_at_bottom(self, num_rows: int) -> bool:
@@ -306,20 +593,22 @@ class WordDocumentEditor:
             raise ValueError("Document not loaded. Call load_document() first.")
         
         # Find the first table
-        if not self.document.tables:
-            print("Warning: No tables found in the document")
+        table = self._get_first_table()
+        if table is None:
+            logger.warning("Warning: No tables found in the document")
             return False
         
-        table = self.document.tables[0]
+        self._invalidate_cache()
+        self._next_free_row_idx = None
         
         try:
             total_rows = len(table.rows)
             
             if total_rows == 0:
-                print("Warning: Table has no rows")
+                logger.warning("Warning: Table has no rows")
                 return False
             
-            print(f"Table has {total_rows} rows, adding {num_rows} rows at the bottom")
+            logger.debug("Table has %s rows, adding %s rows at the bottom", total_rows, num_rows)
             
             # Get the number of columns from the first row
             num_cols = len(table.rows[0].cells)
@@ -327,16 +616,17 @@ class WordDocumentEditor:
             # Add rows at the bottom
             for i in range(num_rows):
                 new_row = table.add_row()
-                # Ensure the new row has the same number of cells as other rows
-                while len(new_row.cells) < num_cols:
+                # add_row() creates one cell per grid column, so this normally adds nothing.
+                # Count once: row.cells follows the grid and would not grow inside a loop.
+                for _ in range(num_cols - len(new_row.cells)):
                     new_row._element.append(new_row._element._new_tc())
             
-            print(f"Successfully added {num_rows} rows to the table")
-            print(f"Table now has {len(table.rows)} rows")
+            logger.debug("Successfully added %s rows to the table", num_rows)
+            logger.debug("Table now has %s rows", len(table.rows))
             return True
             
         except Exception as e:
-            print(f"Error adding rows to table: {e}")
+            logger.error("Error adding rows to table: %s", e)
             return False
     
     def add_working_item_to_first_free_row(
@@ -364,22 +654,18 @@ class WordDocumentEditor:
             raise ValueError("Document not loaded. Call load_document() first.")
         
         # Find the first table
-        if not self.document.tables:
-            print("Warning: No tables found in the document")
+        table = self._get_first_table()
+        if table is None:
+            logger.warning("Warning: No tables found in the document")
             return False
         
-        table = self.document.tables[0]
+        self._invalidate_cache()
         
         try:
-            # Find the first free row (starting from row 1, skipping header row 0)
-            free_row_index = None
-            
-            for row_idx in range(1, len(table.rows)):
-                # Check if the first cell (date column) is empty
-                first_cell_text = table.rows[row_idx].cells[0].text.strip()
-                if not first_cell_text:
-                    free_row_index = row_idx
-                    break
+            # Find the first free row (starting from row 1, skipping header row 0).
+            # Rows before the one filled last were not free then, so continue from there.
+            free_rows = self._free_row_indices(table, self._next_free_row_idx or 1)
+            free_row_index = free_rows[0] if free_rows else None
             
             # If no free row found, add a new row at the end
             if free_row_index is None:
@@ -387,25 +673,134 @@ class WordDocumentEditor:
                 free_row_index = len(table.rows) - 1
             
             # Fill the free row with the working item data
-            row = table.rows[free_row_index]
+            self._fill_working_item_row(table.rows[free_row_index], date, topic, efforts, hours, hours_display)
+            self._next_free_row_idx = free_row_index + 1
             
-            # Ensure the row has enough cells
-            while len(row.cells) < 4:
-                row._element.append(row._element._new_tc())
+            logger.debug("Added working item to row %s: %s - %s", free_row_index + 1, date, topic)
+            return True
+            
+        except Exception as e:
+            logger.error("Error adding working item to table: %s", e)
+            return False
+    
+    def fill_working_items(self, entries: List[Dict]) -> bool:
+        """
+        Add working items to the free rows of the first table, in order.
+        
+        Same result as calling add_working_item_to_first_free_row() for each
+        entry, but the free rows are looked up only once.
+        
+        Args:
+            entries (List[Dict]): Working items, each with keys: date, topic, efforts,
+                hours, and optionally hours_display
             
-            # Set the cell values
-            row.cells[0].text = str(date)
-            row.cells[1].text = str(topic)
-            row.cells[2].text = str(efforts)
-            row.cells[3].text = hours_display if hours_display is not None else f"{hours:.2f}"
+        Returns:
+            bool: True if all items were added successfully, False otherwise
+        """
+        if not self.document:
+            raise ValueError("Document not loaded. Call load_document() first.")
+        
+        # Find the first table
+        table = self._get_first_table()
+        if table is None:
+            logger.warning("Warning: No tables found in the document")
+            return False
+        
+        self._invalidate_cache()
+        self._next_free_row_idx = None
+        
+        try:
+            rows = list(table.rows)
+            free_rows = iter(self._free_row_indices(table))
+            
+            for entry in entries:
+                row_idx = next(free_rows, None)
+                
+                # If no free row found, add a new row at the end
+                if row_idx is None:
+                    rows.append(table.add_row())
+                    row_idx = len(rows) - 1
+                
+                self._fill_working_item_row(
+                    rows[row_idx],
+                    entry['date'],
+                    entry['topic'],
+                    entry['efforts'],
+                    entry['hours'],
+                    entry.get('hours_display'),
+                )
+                logger.debug("Added working item to row %s: %s - %s", row_idx + 1, entry['date'], entry['topic'])
             
-            print(f"Added working item to row {free_row_index + 1}: {date} - {topic}")
             return True
             
         except Exception as e:
-            print(f"Error adding working item to table: {e}")
+            logger.error("Error adding working items to table: %s", e)
             return False
     
+    @staticmethod
+    def _free_row_indices(table, start: int = 1) -> List[int]:
+        """
+        Find the rows after the header row whose first cell (the date column) is empty.
+        
+        Args:
+            table: Table to search
+            start (int): Index of the first row to consider, defaults to the row after the header
+            
+        Returns:
+            List[int]: Indices of the free rows, in order
+        """
+        tbl = table._tbl
+        # One XPath query over the table instead of joining each first cell's text in Python
+        free_rows = tbl.xpath(f"./w:tr[position() > {int(start)}][normalize-space(w:tc[1]) = '']")
+        if not free_rows:
+            return []
+        row_indices = {tr: index for index, tr in enumerate(tbl.tr_lst)}
+        return [row_indices[tr] for tr in free_rows]
+    
+    @staticmethod
+    def _fill_working_item_row(row, date: str, topic: str, efforts: str, hours: float, hours_display: Optional[str]):
+        """
+        Write a working item into the first four cells of a table row.
+        
+        Args:
+            row: Table row to fill
+            date (str): Date of the work item
+            topic (str): Topic of the work item
+            efforts (str): Description of efforts/work done
+            hours (float): Number of hours worked
+            hours_display (str, optional): If set, shown in the hours column instead of formatted hours
+        """
+        # Ensure the row has enough cells
+        cells = row.cells
+        if len(cells) < 4:
+            for _ in range(4 - len(cells)):
+                row._element.append(row._element._new_tc())
+            cells = row.cells
+            # row.cells follows the table grid, so cells beyond it stay invisible
+            if len(cells) < 4:
+                raise ValueError(f"Table row has {len(cells)} columns, expected at least 4")
+        
+        # Set the cell values
+        texts = [str(date), str(topic), str(efforts), hours_display if hours_display is not None else f"{hours:.2f}"]
+        for cell, text in zip(cells, texts):
+            WordDocumentEditor._set_cell_text(cell, text)
+    
+    @staticmethod
+    def _set_cell_text(cell, text: str, bold: bool = False):
+        """
+        Replace the content of a table cell with a single paragraph holding the text.
+        
+        Same as cell.text = text, with the new paragraph parsed in one go.
+        
+        Args:
+            cell: Table cell to write
+            text (str): Text of the cell
+            bold (bool): Make the text bold
+        """
+        tc = cell._tc
+        tc.clear_content()
+        tc.append(parse_xml(f'<w:p {nsdecls("w")}>{_run_xml(text, bold)}</w:p>'))
+    
     def set_last_row_totals(self, total_hours: float) -> bool:
         """
         Set the last row of the first table to show "TOTAL" in the first column
@@ -421,43 +816,39 @@ class WordDocumentEditor:
             raise ValueError("Document not loaded. Call load_document() first.")
         
         # Find the first table
-        if not self.document.tables:
-            print("Warning: No tables found in the document")
+        table = self._get_first_table()
+        if table is None:
+            logger.warning("Warning: No tables found in the document")
             return False
         
-        table = self.document.tables[0]
+        self._invalidate_cache()
+        self._next_free_row_idx = None
         
         try:
             total_rows = len(table.rows)
             if total_rows == 0:
-                print("Warning: Table has no rows")
+                logger.warning("Warning: Table has no rows")
                 return False
             
             last_row = table.rows[total_rows - 1]
             
+            last_row_cells = last_row.cells
+            
             # Set "TOTAL" in the first column (index 0)
-            if len(last_row.cells) > 0:
-                # Clear existing content and add "TOTAL" in bold
-                first_cell = last_row.cells[0]
-                first_cell.text = ""  # Clear existing content
-                paragraph = first_cell.paragraphs[0]
-                run = paragraph.add_run("TOTAL")
-                run.bold = True
+            if len(last_row_cells) > 0:
+                # Replace existing content with "TOTAL" in bold
+                self._set_cell_text(last_row_cells[0], "TOTAL", bold=True)
             
             # Set total hours in the fourth column (index 3)
-            if len(last_row.cells) > 3:
-                # Clear existing content and add total hours in bold
-                fourth_cell = last_row.cells[3]
-                fourth_cell.text = ""  # Clear existing content
-                paragraph = fourth_cell.paragraphs[0]
-                run = paragraph.add_run(f"{total_hours:.2f}")
-                run.bold = True
-            
-            print(f"Set last row totals: 'TOTAL' in column 1, '{total_hours:.2f}' hours in column 4")
+            if len(last_row_cells) > 3:
+                # Replace existing content with total hours in bold
+                self._set_cell_text(last_row_cells[3], f"{total_hours:.2f}", bold=True)
+            
+            logger.info("Set last row totals: 'TOTAL' in column 1, '%.2f' hours in column 4", total_hours)
             return True
             
         except Exception as e:
-            print(f"Error setting last row totals: {e}")
+            logger.error("Error setting last row totals: %s", e)
             return False
     
     def format_table(self) -> bool:
@@ -475,58 +866,58 @@ class WordDocumentEditor:
             raise ValueError("Document not loaded. Call load_document() first.")
         
         # Find the first table
-        if not self.document.tables:
-            print("Warning: No tables found in the document")
+        table = self._get_first_table()
+        if table is None:
+            logger.warning("Warning: No tables found in the document")
             return False
         
-        table = self.document.tables[0]
-        
         try:
             total_rows = len(table.rows)
             if total_rows == 0:
-                print("Warning: Table has no rows")
+                logger.warning("Warning: Table has no rows")
                 return False
             
-            print(f"Formatting table with {total_rows} rows...")
+            logger.info("Formatting table with %s rows...", total_rows)
             
             # Define colors
             green_bg = RGBColor(0, 176, 80)  # #00B050
             white_font = RGBColor(255, 255, 255)  # #FFFFFF
             
-            # Format all rows
-            for row_idx, row in enumerate(table.rows):
-                for cell_idx, cell in enumerate(row.cells):
-                    # Set font size to 9pt for all paragraphs in the cell
-                    for paragraph in cell.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.size = Pt(9)
-                    
-                    # Set center alignment for column 4 (hours column, index 3)
-                    if cell_idx == 3:
-                        for paragraph in cell.paragraphs:
-                            paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    
-                    # Special formatting for the last row
-                    if row_idx == total_rows - 1:
-                        # Set background color for the last row
-                        cell._tc.get_or_add_tcPr().append(
-                            self._create_shading_element(green_bg)
-                        )
-                        
-                        # Set font color to white for the last row
-                        for paragraph in cell.paragraphs:
-                            for run in paragraph.runs:
-                                run.font.color.rgb = white_font
-            
-            print(f"Successfully formatted table:")
-            print(f"- Set font size to 9pt for all rows")
-            print(f"- Set center alignment for column 4 (hours)")
-            print(f"- Set last row background to green (#00B050)")
-            print(f"- Set last row font color to white (#FFFFFF)")
+            # Work on the XML elements directly: the same edits as run.font.size,
+            # paragraph.alignment and run.font.color.rgb, without a wrapper per run
+            tbl = table._tbl
+            
+            # Set font size to 9pt for all runs in all rows
+            nine_pt = Pt(9)
+            for r in tbl.xpath('./w:tr/w:tc/w:p/w:r'):
+                r.get_or_add_rPr().sz_val = nine_pt
+            
+            # Set center alignment for column 4 (hours column, index 3)
+            for p in tbl.xpath('./w:tr/w:tc[4]/w:p'):
+                p.get_or_add_pPr().jc_val = WD_ALIGN_PARAGRAPH.CENTER
+            
+            # Special formatting for the last row
+            for cell in table.rows[total_rows - 1].cells:
+                # Set background color for the last row
+                cell._tc.get_or_add_tcPr().append(
+                    self._create_shading_element(green_bg)
+                )
+                
+                # Set font color to white for the last row
+                for r in cell._tc.xpath('./w:p/w:r'):
+                    rPr = r.get_or_add_rPr()
+                    rPr._remove_color()
+                    rPr.get_or_add_color().val = white_font
+            
+            logger.info("Successfully formatted table:")
+            logger.info("- Set font size to 9pt for all rows")
+            logger.info("- Set center alignment for column 4 (hours)")
+            logger.info("- Set last row background to green (#00B050)")
+            logger.info("- Set last row font color to white (#FFFFFF)")
             return True
             
         except Exception as e:
-            print(f"Error formatting table: {e}")
+            logger.error("Error formatting table: %s", e)
             return False
     
     def format_payment_instruction(self) -> bool:
@@ -543,32 +934,28 @@ class WordDocumentEditor:
         try:
             payment_instruction_found = False
             
-            # Search through all paragraphs for the payment instruction
-            for paragraph in self.document.paragraphs:
-                paragraph_text = paragraph.text.lower()
-                
+            # Search through the paragraphs for the payment instruction, stopping at the first match
+            for paragraph in self._iter_body_paragraphs():
                 # Check if this paragraph contains payment instruction keywords
-                if ("please transfer" in paragraph_text and 
-                    "bank account" in paragraph_text and 
-                    "at latest" in paragraph_text):
+                if _PAYMENT_INSTRUCTION_RE.match(paragraph.text):
                     
                     # Make all runs in this paragraph bold
                     for run in paragraph.runs:
                         run.bold = True
                     
-                    print(f"Made payment instruction bold: '{paragraph.text[:50]}...'")
+                    logger.info("Made payment instruction bold: '%s...'", paragraph.text[:50])
                     payment_instruction_found = True
                     break
             
             if not payment_instruction_found:
-                print("Warning: Payment instruction line not found")
-                print("Looking for text containing 'Please transfer', 'bank account', and 'at latest'")
+                logger.warning("Warning: Payment instruction line not found")
+                logger.warning("Looking for text containing 'Please transfer', 'bank account', and 'at latest'")
                 return False
             
             return True
             
         except Exception as e:
-            print(f"Error formatting payment instruction: {e}")
+            logger.error("Error formatting payment instruction: %s", e)
             return False
     
     def _create_shading_element(self, color: RGBColor):
@@ -581,18 +968,12 @@ class WordDocumentEditor:
         Returns:
             The shading element
         """
-        from docx.oxml import parse_xml
-        from docx.oxml.ns import nsdecls
-        
         # Convert RGBColor to hex string
         # RGBColor stores values as integers, access them directly
         hex_color = f"{color[0]:02x}{color[1]:02x}{color[2]:02x}"
         
         # Create the shading element
-        shading_xml = f'''
-        <w:shd {nsdecls('w')} w:fill="{hex_color}" />
-        '''
-        return parse_xml(shading_xml)
+        return parse_xml(_SHADING_XML.format(fill=hex_color))
     
     def save_document(self, output_path: str) -> bool:
         """
@@ -610,39 +991,79 @@ class WordDocumentEditor:
         try:
             # Create output directory if it doesn't exist
             output_dir = os.path.dirname(output_path)
-            if output_dir and not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-            
-            # Validate document before saving
-            if not self._validate_document():
-                print("Warning: Document validation failed, but attempting to save anyway...")
-            
-            # Save the document
-            self.document.save(output_path)
-            
-            # Set proper file permissions (readable and writable by owner)
-            import stat
-            os.chmod(output_path, stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
-            
-            # Verify the file was created and is readable
-            if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
-                print(f"Document saved successfully: {output_path}")
-                print(f"File size: {os.path.getsize(output_path)} bytes")
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            
+            # Validate document before saving, if asked to
+            if self.validate_on_save and not self._validate_document():
+                logger.warning("Warning: Document validation failed, but attempting to save anyway...")
+            
+            # Build the .docx in memory and write it out in one go
+            buffer = io.BytesIO()
+            self.document.save(buffer)
+            data = buffer.getvalue()
+            
+            # Write next to the target and swap it in, so nobody ever sees a half-written file
+            temp_path = output_path + ".tmp"
+            try:
+                # Created readable and writable by owner, readable by others (subject to the umask)
+                flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+                with os.fdopen(os.open(temp_path, flags, 0o644), 'wb') as f:
+                    f.write(data)
+                
+                os.replace(temp_path, output_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+            
+            self._saved_docx = (os.path.abspath(output_path), data)
+            
+            # Verify the file was written completely
+            if data and os.stat(output_path).st_size == len(data):
+                logger.info("Document saved successfully: %s", output_path)
+                logger.info("File size: %s bytes", len(data))
                 return True
             else:
-                print(f"Error: Document was not saved properly or file is empty")
+                logger.error("Error: Document was not saved properly or file is empty")
                 return False
                 
         except Exception as e:
-            print(f"Error saving document: {e}")
-            print(f"Output path: {output_path}")
-            print(f"Directory exists: {os.path.exists(os.path.dirname(output_path))}")
+            logger.error("Error saving document: %s", e)
+            logger.error("Output path: %s", output_path)
+            logger.error("Directory exists: %s", os.path.exists(os.path.dirname(output_path)))
             return False
     
+    @classmethod
+    def _find_libreoffice(cls) -> Optional[str]:
+        """
+        Find the LibreOffice command, once per process.
+        
+        Returns:
+            Optional[str]: The first available LibreOffice command, or None if there is none
+        """
+        if cls._libreoffice_cmd is None:
+            for libreoffice_cmd in _LIBREOFFICE_COMMANDS:
+                # Look the command up instead of starting LibreOffice just to see if it runs
+                if os.path.isabs(libreoffice_cmd):
+                    found = os.path.isfile(libreoffice_cmd) and os.access(libreoffice_cmd, os.X_OK)
+                else:
+                    found = shutil.which(libreoffice_cmd) is not None
+                if found:
+                    cls._libreoffice_cmd = libreoffice_cmd
+                    break
+        return cls._libreoffice_cmd
+    
     def convert_to_pdf(self, word_path: str) -> bool:
         """
         Convert a Word document to PDF using LibreOffice.
         
+        The document is converted in a local temporary folder and only the
+        finished PDF is moved next to word_path, so LibreOffice never reads from
+        or writes to the (possibly network or cloud-synced) invoice folder. If
+        word_path was written by save_document(), the bytes saved then are used
+        instead of reading the file back.
+        
         Args:
             word_path (str): Path to the Word document to convert
             
@@ -650,85 +1071,199 @@ class WordDocumentEditor:
             bool: True if conversion was successful, False otherwise
         """
         if not os.path.exists(word_path):
-            print(f"Error: Word document not found: {word_path}")
+            logger.error("Error: Word document not found: %s", word_path)
             return False
         
-        try:
-            # Generate PDF path (replace .docx with .pdf)
-            pdf_path = word_path.replace('.docx', '.pdf')
+        with tempfile.TemporaryDirectory(prefix='invoice_pdf_') as work_dir:
+            return self._convert_to_pdf(word_path, work_dir)
+    
+    def _convert_to_pdf(self, word_path: str, work_dir: str) -> bool:
+        """
+        Convert a Word document to PDF using LibreOffice, see convert_to_pdf().
+        
+        Args:
+            word_path (str): Path to the Word document to convert
+            work_dir (str): Local temporary folder for the conversion
             
-            # Get the directory of the Word document
-            output_dir = os.path.dirname(word_path)
+        Returns:
+            bool: True if conversion was successful, False otherwise
+        """
+        try:
+            # Generate PDF path (same name with a .pdf extension)
+            pdf_path = os.path.splitext(word_path)[0] + '.pdf'
+            
+            # Convert a local copy: the bytes from save_document() when they are for this file
+            source_path = os.path.join(work_dir, os.path.basename(word_path))
+            saved = self._saved_docx
+            if saved is not None and saved[0] == os.path.abspath(word_path):
+                with open(source_path, 'wb') as f:
+                    f.write(saved[1])
+            else:
+                _copy_file(word_path, source_path)
+            converted_path = os.path.splitext(source_path)[0] + '.pdf'
             
-            print(f"Converting Word document to PDF...")
-            print(f"Source: {word_path}")
-            print(f"Target: {pdf_path}")
+            logger.info("Converting Word document to PDF...")
+            logger.info("Source: %s", word_path)
+            logger.info("Target: %s", pdf_path)
             
             # Use LibreOffice to convert Word to PDF
             # --headless: Run without GUI
             # --convert-to pdf: Convert to PDF format
             # --outdir: Specify output directory
+            libreoffice_cmd = self._find_libreoffice()
+            if libreoffice_cmd is None:
+                raise FileNotFoundError("LibreOffice command not found")
             
-            # Try different LibreOffice command paths
-            libreoffice_commands = [
-                'libreoffice',  # Standard command
-                '/Applications/LibreOffice.app/Contents/MacOS/soffice',  # macOS app bundle
-                '/usr/bin/libreoffice',  # Linux/Ubuntu
-                '/usr/local/bin/libreoffice'  # Homebrew on Intel Mac
+            cmd = [
+                libreoffice_cmd,
+                '--headless',
+                '--convert-to', 'pdf',
+                '--outdir', work_dir,
+                source_path
             ]
-            
-            cmd = None
-            for libreoffice_cmd in libreoffice_commands:
-                try:
-                    # Test if the command exists
-                    subprocess.run([libreoffice_cmd, '--version'], 
-                                 capture_output=True, timeout=5)
-                    cmd = [
-                        libreoffice_cmd,
-                        '--headless',
-                        '--convert-to', 'pdf',
-                        '--outdir', output_dir,
-                        word_path
-                    ]
-                    print(f"Using LibreOffice command: {libreoffice_cmd}")
-                    break
-                except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.CalledProcessError):
-                    continue
-            
-            if cmd is None:
-                raise FileNotFoundError("LibreOffice command not found")
+            logger.info("Using LibreOffice command: %s", libreoffice_cmd)
             
             # Run the conversion command
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
             
             if result.returncode == 0:
-                # Verify the PDF was created
-                if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 0:
-                    print(f"PDF created successfully: {pdf_path}")
-                    print(f"PDF file size: {os.path.getsize(pdf_path)} bytes")
+                # Verify the PDF was created; a PDF left next to word_path by an earlier run does not count
+                if os.path.exists(converted_path) and os.path.getsize(converted_path) > 0:
+                    # Move the PDF from the local folder next to the Word document
+                    shutil.move(converted_path, pdf_path)
+                    logger.info("PDF created successfully: %s", pdf_path)
+                    logger.info("PDF file size: %s bytes", os.path.getsize(pdf_path))
                     return True
                 else:
-                    print(f"Error: PDF file was not created or is empty")
+                    logger.error("Error: PDF file was not created or is empty")
                     return False
             else:
-                print(f"Error: LibreOffice conversion failed")
-                print(f"Return code: {result.returncode}")
-                print(f"Error output: {result.stderr}")
+                logger.error("Error: LibreOffice conversion failed")
+                logger.error("Return code: %s", result.returncode)
+                logger.error("Error output: %s", result.stderr)
                 return False
                 
         except subprocess.TimeoutExpired:
-            print("Error: PDF conversion timed out after 60 seconds")
+            logger.error("Error: PDF conversion timed out after 60 seconds")
             return False
         except FileNotFoundError:
-            print("Error: LibreOffice not found. Please install LibreOffice to convert documents to PDF.")
-            print("Installation instructions:")
-            print("- macOS: brew install --cask libreoffice")
-            print("- Ubuntu/Debian: sudo apt-get install libreoffice")
-            print("- Windows: Download from https://www.libreoffice.org/")
+            logger.error("Error: LibreOffice not found. Please install LibreOffice to convert documents to PDF.")
+            logger.error("Installation instructions:")
+            logger.error("- macOS: brew install --cask libreoffice")
+            logger.error("- Ubuntu/Debian: sudo apt-get install libreoffice")
+            logger.error("- Windows: Download from https://www.libreoffice.org/")
             return False
         except Exception as e:
-            print(f"Error converting to PDF: {e}")
+            logger.error("Error converting to PDF: %s", e)
+            return False
+    
+    def convert_to_pdf_async(self, word_path: str) -> subprocess.Popen:
+        """
+        Start converting a Word document on disk to PDF, without waiting for LibreOffice.
+        
+        The PDF is written next to the Word document. Build the next document while
+        this runs, then pass the returned process to wait_for_conversion().
+        
+        Args:
+            word_path (str): Path to the Word document to convert
+            
+        Returns:
+            subprocess.Popen: The running LibreOffice process
+            
+        Raises:
+            FileNotFoundError: If the Word document or LibreOffice is not found
+        """
+        if not os.path.exists(word_path):
+            raise FileNotFoundError(f"Word document not found: {word_path}")
+        
+        libreoffice_cmd = self._find_libreoffice()
+        if libreoffice_cmd is None:
+            raise FileNotFoundError("LibreOffice command not found")
+        
+        output_dir = os.path.dirname(word_path) or '.'
+        logger.info("Converting Word document to PDF in the background: %s", word_path)
+        return subprocess.Popen(
+            [libreoffice_cmd, '--headless', '--convert-to', 'pdf', '--outdir', output_dir, word_path],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+        )
+    
+    @staticmethod
+    def wait_for_conversion(process: subprocess.Popen, pdf_path: str, timeout: float = 60) -> bool:
+        """
+        Wait for a conversion started by convert_to_pdf_async() to finish.
+        
+        Args:
+            process (subprocess.Popen): The LibreOffice process
+            pdf_path (str): Path of the expected PDF, the Word document's path with a .pdf extension
+            timeout (float): Seconds to wait before giving up and stopping LibreOffice
+            
+        Returns:
+            bool: True if conversion was successful, False otherwise
+        """
+        try:
+            _, stderr = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            logger.error("Error: PDF conversion timed out after %s seconds", timeout)
+            return False
+        
+        if process.returncode != 0:
+            logger.error("Error: LibreOffice conversion failed")
+            logger.error("Return code: %s", process.returncode)
+            logger.error("Error output: %s", stderr)
             return False
+        
+        if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 0:
+            logger.info("PDF created successfully: %s", pdf_path)
+            return True
+        logger.error("Error: PDF file was not created or is empty")
+        return False
+    
+    @classmethod
+    def convert_many_to_pdf(cls, word_paths: List[str], output_dir: str) -> List[str]:
+        """
+        Convert several Word documents to PDF with a single LibreOffice run,
+        so LibreOffice starts up only once for the whole batch.
+        
+        Args:
+            word_paths (List[str]): Paths to the Word documents to convert
+            output_dir (str): Folder to write the PDFs to
+            
+        Returns:
+            List[str]: Paths of the PDFs that were created, in the order of word_paths
+        """
+        if not word_paths:
+            return []
+        
+        libreoffice_cmd = cls._find_libreoffice()
+        if libreoffice_cmd is None:
+            logger.error("Error: LibreOffice not found. Please install LibreOffice to convert documents to PDF.")
+            return []
+        
+        os.makedirs(output_dir, exist_ok=True)
+        cmd = [libreoffice_cmd, '--headless', '--convert-to', 'pdf', '--outdir', output_dir, *word_paths]
+        logger.info("Converting %s Word documents to PDF in %s...", len(word_paths), output_dir)
+        
+        try:
+            # Same 60 seconds per document as convert_to_pdf()
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60 * len(word_paths))
+        except subprocess.TimeoutExpired:
+            logger.error("Error: PDF conversion timed out after %s seconds", 60 * len(word_paths))
+            return []
+        
+        if result.returncode != 0:
+            logger.error("Error: LibreOffice conversion failed")
+            logger.error("Return code: %s", result.returncode)
+            logger.error("Error output: %s", result.stderr)
+        
+        pdf_paths = [
+            os.path.join(output_dir, os.path.splitext(os.path.basename(word_path))[0] + '.pdf')
+            for word_path in word_paths
+        ]
+        created = [pdf_path for pdf_path in pdf_paths if os.path.exists(pdf_path) and os.path.getsize(pdf_path) > 0]
+        logger.info("Created %s of %s PDFs", len(created), len(word_paths))
+        return created
     
     def copy_pdf_to_folder(self, pdf_path: str, copy_to_folder: str, output_folder_name: str) -> bool:
         """
@@ -743,44 +1278,65 @@ class WordDocumentEditor:
             bool: True if copy was successful, False otherwise
         """
         if not os.path.exists(pdf_path):
-            print(f"Error: PDF file not found: {pdf_path}")
+            logger.error("Error: PDF file not found: %s", pdf_path)
             return False
         
         if not copy_to_folder:
-            print("Warning: No copy folder specified, skipping PDF copy")
+            logger.warning("Warning: No copy folder specified, skipping PDF copy")
             return True
         
         try:
             # Create the destination subfolder
             destination_subfolder = os.path.join(copy_to_folder, output_folder_name)
             
-            print(f"Creating destination folder: {destination_subfolder}")
+            logger.info("Creating destination folder: %s", destination_subfolder)
             os.makedirs(destination_subfolder, exist_ok=True)
             
             # Get the PDF filename
             pdf_filename = os.path.basename(pdf_path)
             destination_path = os.path.join(destination_subfolder, pdf_filename)
             
-            print(f"Copying PDF...")
-            print(f"Source: {pdf_path}")
-            print(f"Destination: {destination_path}")
+            logger.info("Copying PDF...")
+            logger.info("Source: %s", pdf_path)
+            logger.info("Destination: %s", destination_path)
             
             # Copy the PDF file
-            shutil.copy2(pdf_path, destination_path)
+            _copy_file(pdf_path, destination_path)
             
             # Verify the copy was successful
             if os.path.exists(destination_path) and os.path.getsize(destination_path) > 0:
-                print(f"PDF copied successfully!")
-                print(f"Copied file size: {os.path.getsize(destination_path)} bytes")
+                logger.info("PDF copied successfully!")
+                logger.info("Copied file size: %s bytes", os.path.getsize(destination_path))
                 return True
             else:
-                print(f"Error: PDF copy verification failed")
+                logger.error("Error: PDF copy verification failed")
                 return False
                 
         except Exception as e:
-            print(f"Error copying PDF: {e}")
+            logger.error("Error copying PDF: %s", e)
             return False
     
+    @classmethod
+    def process_batch(cls, template_path: str, jobs: List[Dict], max_workers: Optional[int] = None) -> List[bool]:
+        """
+        Fill and save several documents from the same template in parallel processes.
+        
+        Args:
+            template_path (str): Path to the Word document template
+            jobs (List[Dict]): One entry per document, with keys: output_path, and optionally
+                replacements (text to find -> replacement) and working_items (as for fill_working_items)
+            max_workers (int, optional): Number of worker processes, defaults to the number of CPUs
+            
+        Returns:
+            List[bool]: Whether each document was saved successfully, in the order of the jobs
+        """
+        if not jobs:
+            return []
+        
+        # Parsing and filling hold the GIL, so the documents are built in separate processes
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_process_batch_job, repeat(template_path), jobs))
+    
     def get_template_filename(self) -> str:
         """
         Get the template filename.
@@ -788,7 +1344,7 @@ class WordDocumentEditor:
         Returns:
             str: The template filename
         """
-        return os.path.basename(self.template_path)
+        return self._template_filename
     
     def generate_output_filename(self, last_month_formatted: str, alternative_today_date=None) -> str:
         """
@@ -801,27 +1357,20 @@ class WordDocumentEditor:
         Returns:
             str: Generated output filename
         """
-        template_filename = self.get_template_filename()
+        parts = self._template_filename_parts
         
         # Replace [LAST_MONTH] with the formatted last month
-        output_filename = template_filename.replace("[LAST_MONTH]", last_month_formatted)
+        replacements = {"[LAST_MONTH]": last_month_formatted}
         
         # Replace [TODAY] with current date or alternative date in YYYY-mm-dd format
-        if alternative_today_date:
-            today_formatted = alternative_today_date.strftime('%Y-%m-%d')
-        else:
-            today_formatted = datetime.now().strftime('%Y-%m-%d')
-        output_filename = output_filename.replace("[TODAY]", today_formatted)
+        if "[TODAY]" in parts:
+            replacements["[TODAY]"] = (alternative_today_date or datetime.now()).strftime('%Y-%m-%d')
         
-        return output_filename
+        return ''.join(replacements.get(part, part) for part in parts)
     
-    def get_document_info(self) -> Dict[str, str]:
-        """
-        Get information about the loaded document.
-        
-        Returns:
-            Dict[str, str]: Document information
-        """
+    @cached_property
+    def document_info(self) -> Dict[str, str]:
+        """Information about the loaded document, computed once until the document changes."""
         if not self.document:
             return {"status": "not_loaded"}
         
@@ -832,6 +1381,15 @@ class WordDocumentEditor:
             "tables_count": len(self.document.tables)
         }
     
+    def get_document_info(self) -> Dict[str, str]:
+        """
+        Get information about the loaded document.
+        
+        Returns:
+            Dict[str, str]: Document information
+        """
+        return dict(self.document_info)
+    
     def read_table_cell(self, row: int, col: int) -> str:
         """
         Read a specific cell from the first table.
@@ -849,11 +1407,10 @@ class WordDocumentEditor:
         if not self.document:
             raise ValueError("Document not loaded. Call load_document() first.")
         
-        if not self.document.tables:
+        table = self._get_first_table()
+        if table is None:
             raise ValueError("No tables found in the document")
         
-        table = self.document.tables[0]
-        
         if row >= len(table.rows):
             raise ValueError(f"Row {row} is out of bounds. Table has {len(table.rows)} rows.")
         
@@ -864,6 +1421,15 @@ class WordDocumentEditor:
         
         return row_obj.cells[col].text.strip()
     
+    def validate(self) -> bool:
+        """
+        Check the loaded document for emptiness and signs of corruption.
+        
+        Returns:
+            bool: True if document is valid, False otherwise
+        """
+        return self._validate_document()
+    
     def _validate_document(self) -> bool:
         """
         Validate the document structure before saving.
@@ -875,19 +1441,45 @@ class WordDocumentEditor:
             return False
         
         try:
+            # Both checks run as XPath queries on the body, without wrapping paragraphs in Python objects
+            body = self.document.element.body
+            
             # Check if document has content
-            if len(self.document.paragraphs) == 0 and len(self.document.tables) == 0:
-                print("Warning: Document appears to be empty")
+            if not _XP_HAS_CONTENT(body):
+                logger.warning("Warning: Document appears to be empty")
                 return False
             
             # Check for any obvious corruption indicators
-            for paragraph in self.document.paragraphs:
-                if paragraph.text and len(paragraph.text) > 10000:  # Very long paragraphs might indicate corruption
-                    print("Warning: Found unusually long paragraph, possible corruption")
-                    return False
+            if _XP_LONG_PARAGRAPH(body):
+                logger.warning("Warning: Found unusually long paragraph, possible corruption")
+                return False
             
             return True
             
         except Exception as e:
-            print(f"Document validation error: {e}")
+            logger.error("Document validation error: %s", e)
+            return False
+
+
+def _process_batch_job(template_path: str, job: Dict) -> bool:
+    """
+    Fill and save one document of WordDocumentEditor.process_batch() in a worker process.
+    
+    Args:
+        template_path (str): Path to the Word document template
+        job (Dict): Job description, see process_batch()
+        
+    Returns:
+        bool: True if the document was saved successfully, False otherwise
+    """
+    with WordDocumentEditor(template_path) as editor:
+        if not editor.load_document():
             return False
+        
+        if job.get('replacements'):
+            editor.find_and_replace_all(job['replacements'])
+        
+        if job.get('working_items') and not editor.fill_working_items(job['working_items']):
+            return False
+        
+        return editor.save_document(job['output_path'])
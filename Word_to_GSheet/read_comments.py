@@ -1,11 +1,22 @@
+import functools
+import glob
+import io
+import multiprocessing
 import os
 import sys
 import zipfile
-import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 import re
 
+try:
+    # lxml (installed with python-docx) parses and evaluates XPath in C
+    from lxml import etree as ET
+    _HAVE_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAVE_LXML = False
+
 # gspread auth like in google_doc_reader
 import gspread
 from google.oauth2.service_account import Credentials
@@ -25,36 +36,206 @@ NS = {
     "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
 }
 
+# Clark names ("{namespace}local") of the tags and attributes looked up per element
+_T_COMMENT = f"{{{NS['w']}}}comment"
+_T_COMMENT_EX = f"{{{NS['w15']}}}commentEx"
+_T_P = f"{{{NS['w']}}}p"
+_T_T = f"{{{NS['w']}}}t"
+_T_BR = f"{{{NS['w']}}}br"
+_T_COMMENT_RANGE_START = f"{{{NS['w']}}}commentRangeStart"
+_T_COMMENT_RANGE_END = f"{{{NS['w']}}}commentRangeEnd"
+_T_PPR = f"{{{NS['w']}}}pPr"
+_T_PSTYLE = f"{{{NS['w']}}}pStyle"
+_A_ID = f"{{{NS['w']}}}id"
+_A_ID_W15 = f"{{{NS['w15']}}}id"
+_A_PARENT = f"{{{NS['w']}}}parentId"
+_A_PARENT_W15 = f"{{{NS['w15']}}}parentId"
+_A_AUTHOR = f"{{{NS['w']}}}author"
+_A_INITIALS = f"{{{NS['w']}}}initials"
+_A_DATE = f"{{{NS['w']}}}date"
+_A_VAL = f"{{{NS['w']}}}val"
+_A_PARAID = f"{{{NS['w15']}}}paraId"
+_A_PARAID_W14 = f"{{{NS['w14']}}}paraId"
+_A_PARAIDPARENT = f"{{{NS['w15']}}}paraIdParent"
+_A_DONE = f"{{{NS['w15']}}}done"
+
+# Paragraph styles "Heading1".."Heading3" by suffix; deeper levels are not tracked
+_HEADING_LEVELS = {"1": 1, "2": 2, "3": 3}
+
+# Local names of the anchor elements in the w namespace; others (e.g. a:t in shapes) fall back to splitting
+_ANCHOR_LOCAL_NAMES = {
+    _T_T: "t",
+    _T_BR: "br",
+    _T_COMMENT_RANGE_START: "commentRangeStart",
+    _T_COMMENT_RANGE_END: "commentRangeEnd",
+}
+
+if _HAVE_LXML:
+    # Comments and processing instructions are dropped so that iterating yields elements only.
+    # DOCX parts need no DTD, entities or network access, so none of that is loaded or expanded.
+    _PARSER_OPTIONS = dict(
+        huge_tree=False, collect_ids=False, remove_comments=True, remove_pis=True,
+        resolve_entities=False, no_network=True, load_dtd=False,
+    )
+    # Hot lookups, compiled once
+    _XP_PARAS = ET.XPath(".//w:p", namespaces=NS)
+    # Run texts and soft breaks of a paragraph in one descendant walk, in document order
+    _XP_TS_AND_BRS = ET.XPath(".//w:t/text() | .//w:br", namespaces=NS, smart_strings=False)
+
+    def _texts_and_breaks(p: ET.Element) -> Tuple[List[str], int]:
+        parts: List[str] = []
+        br_count = 0
+        for item in _XP_TS_AND_BRS(p):
+            if item.__class__ is str:
+                parts.append(item)
+            else:
+                br_count += 1
+        return parts, br_count
+
+    def _anchor_nodes(element: ET.Element) -> Iterator[ET.Element]:
+        # Elements rendered into a comment's anchor text, matched by local name in C
+        return element.iter("{*}t", "{*}br", "{*}commentRangeStart", "{*}commentRangeEnd")
+else:
+    # iter() on the Clark tag skips ElementPath (it also yields the element itself, never a match here)
+    def _XP_PARAS(element: ET.Element) -> List[ET.Element]:
+        return list(element.iter(_T_P))
+
+    def _texts_and_breaks(p: ET.Element) -> Tuple[List[str], int]:
+        parts: List[str] = []
+        br_count = 0
+        for e in p.iter():
+            if e.tag == _T_T:
+                if e.text:
+                    parts.append(e.text)
+            elif e.tag == _T_BR:
+                br_count += 1
+        return parts, br_count
+
+    def _anchor_nodes(element: ET.Element) -> Iterator[ET.Element]:
+        return (e for e in element.iter() if e.tag.split("}")[-1] in ("t", "br", "commentRangeStart", "commentRangeEnd"))
+
 def _get_text_from_paragraphs(element: ET.Element) -> str:
     """Concatenate all text within comment paragraphs."""
-    texts: List[str] = []
-    for p in element.findall(".//w:p", NS):
-        # collect texts inside runs
-        parts: List[str] = []
-        for t in p.findall(".//w:t", NS):
-            if t.text:
-                parts.append(t.text)
-        # Handle soft line breaks within a paragraph (w:br) as newlines
-        br_count = len(p.findall(".//w:br", NS))
-        para_text = "".join(parts)
+    # All pieces go into one list that is joined once at the end
+    chunks: List[str] = []
+    for p in _XP_PARAS(element):
+        # collect texts inside runs (only non-empty ones) and count soft line breaks (w:br)
+        parts, br_count = _texts_and_breaks(p)
+        if not parts and not br_count:
+            # Empty paragraphs get no separator either
+            continue
+        if chunks:
+            chunks.append("\n")
+        chunks.extend(parts)
         if br_count > 0:
             # This is a conservative approach; without exact position of br, append newlines
-            para_text = para_text + ("\n" * br_count)
-        if para_text:
-            texts.append(para_text)
-    return "\n".join(texts).strip()
+            chunks.append("\n" * br_count)
+    return "".join(chunks).strip()
+
+def _iter_child_elements(source, tag: str) -> Iterator[ET.Element]:
+    """Stream the root's children with the given Clark tag, releasing each one once the caller moves on."""
+    if _HAVE_LXML:
+        for _, elem in ET.iterparse(source, events=("end",), tag=tag, **_PARSER_OPTIONS):
+            parent = elem.getparent()
+            if parent is None or parent.getparent() is not None:
+                # Not a direct child of the root element
+                continue
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+    else:
+        root = None
+        depth = 0
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            if depth == 1 and elem.tag == tag:
+                yield elem
+                root.clear()
+
+# Requirement IDs in the document text (DSS1 ... DSS999)
+_DSS_RE = re.compile(r'DSS\d{1,3}', re.IGNORECASE)
+
+# Spreadsheet key in a Google Sheets URL
+_SHEET_ID_RE = re.compile(r'/spreadsheets/d/([a-zA-Z0-9\-_]+)')
+
+# Timestamps as Word writes them, already in the form isoformat() produces (apart from the Z)
+_WORD_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(Z?)")
+
+def _iter_outer_paragraphs(source) -> Iterator[ET.Element]:
+    """Stream the outermost w:p elements of a part, complete with any nested (text box) paragraphs.
+
+    Each paragraph is released, together with the paragraphs before it, once the caller moves on.
+    """
+    depth = 0
+    if _HAVE_LXML:
+        for event, p in ET.iterparse(source, events=("start", "end"), tag=_T_P, **_PARSER_OPTIONS):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth:
+                continue
+            yield p
+            p.clear()
+            # Siblings before it under the same parent (body or table cell) are done as well
+            parent = p.getparent()
+            while p.getprevious() is not None:
+                del parent[0]
+    else:
+        # Open elements, so that a finished paragraph can be removed from its parent
+        stack: List[ET.Element] = []
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append(elem)
+                if elem.tag == _T_P:
+                    depth += 1
+                continue
+            stack.pop()
+            if elem.tag != _T_P:
+                continue
+            depth -= 1
+            if depth:
+                continue
+            yield elem
+            if stack:
+                stack[-1].remove(elem)
 
 def _parse_datetime(value: Optional[str]) -> Optional[str]:
     if not value:
         return None
+    m = _WORD_DATETIME_RE.fullmatch(value)
+    if m:
+        # Skip the datetime round trip, only the UTC designator needs spelling out
+        return value[:-1] + "+00:00" if m.group(1) else value
     try:
         # Word usually stores ISO-like timestamps
-        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00") if "Z" in value else value)
         return dt.isoformat()
-    except Exception:
+    except ValueError:
         return value  # fallback to raw if unknown format
 
 class Comment:
+    # No per-instance __dict__: documents can hold thousands of comments
+    __slots__ = (
+        "id",
+        "text",
+        "author",
+        "date_str",
+        "parent_id",
+        "replies",
+        "anchor_paragraph_text",
+        "anchor_paragraph_text_marked",
+        "nearest_heading",
+        "requirement_ID",
+        "resolved",
+    )
+
     def __init__(
         self,
         cid: int,
@@ -84,293 +265,268 @@ class Comment:
 
 class DiscussionReply(Comment):
     """A reply that belongs to a discussion (nested comment via parentId)."""
-    pass
+    __slots__ = ()
 
 def extract_comments_threads(docx_path: str) -> List[Comment]:
     if not os.path.exists(docx_path):
         raise FileNotFoundError(f"File not found: {docx_path}")
 
+    comments: List[Comment] = []
+    by_id: Dict[int, Comment] = {}
+    # paraId -> comment id, only needed to match the entries of commentsExtended.xml
+    para_to_id: Dict[str, int] = {}
+
+    # Open the archive once for all the parts read below
     with zipfile.ZipFile(docx_path, "r") as zf:
+        names = set(zf.namelist())
+        has_extended = "word/commentsExtended.xml" in names
+
         # comments are stored in word/comments.xml
-        try:
-            with zf.open("word/comments.xml") as f:
-                tree = ET.parse(f)
-                root = tree.getroot()
-        except KeyError:
+        if "word/comments.xml" not in names:
             # No comments in the document
             return []
 
-    comments_nodes = root.findall("w:comment", NS)
-    comments: List[Comment] = []
-    by_id: Dict[int, Comment] = {}
-    id_to_para: Dict[int, Optional[str]] = {}
-
-    for node in comments_nodes:
-        # id
-        id_attr = node.get(f"{{{NS['w']}}}id")
-        if id_attr is None:
-            # try w15:id if ever present (very unlikely)
-            id_attr = node.get(f"{{{NS['w15']}}}id")
-        if id_attr is None:
-            # skip malformed entries
-            continue
+        # Decompress the part in one go, then stream the comments from memory;
+        # each one is released once it has been read
+        with io.BytesIO(zf.read("word/comments.xml")) as f:
+            for node in _iter_child_elements(f, _T_COMMENT):
+                # id
+                id_attr = node.get(_A_ID)
+                if id_attr is None:
+                    # try w15:id if ever present (very unlikely)
+                    id_attr = node.get(_A_ID_W15)
+                if id_attr is None:
+                    # skip malformed entries
+                    continue
 
-        try:
-            cid = int(id_attr)
-        except ValueError:
-            # Some rare docs could have non-int ids; skip safely
-            continue
+                try:
+                    cid = int(id_attr)
+                except ValueError:
+                    # Some rare docs could have non-int ids; skip safely
+                    continue
 
-        # parentId for replies (may be w or w15)
-        parent_attr = node.get(f"{{{NS['w']}}}parentId")
-        if parent_attr is None:
-            parent_attr = node.get(f"{{{NS['w15']}}}parentId")
-        parent_id = None
-        if parent_attr is not None:
-            try:
-                parent_id = int(parent_attr)
-            except ValueError:
+                # parentId for replies (may be w or w15)
+                parent_attr = node.get(_A_PARENT)
+                if parent_attr is None:
+                    parent_attr = node.get(_A_PARENT_W15)
                 parent_id = None
-
-        author = node.get(f"{{{NS['w']}}}author")
-        if author is None:
-            # sometimes stored as w:initials or other fields; keep None if not present
-            author = node.get(f"{{{NS['w']}}}initials")
-
-        date_raw = node.get(f"{{{NS['w']}}}date")
-        date_str = _parse_datetime(date_raw)
-
-        # capture paraId from the first paragraph inside the comment (w14/w15)
-        first_p = node.find(".//w:p", NS)
-        para_id = None
-        if first_p is not None:
-            para_id = first_p.get(f"{{{NS['w15']}}}paraId") or first_p.get(f"{{{NS['w14']}}}paraId")
-
-        text = _get_text_from_paragraphs(node)
-
-        # Use DiscussionReply subclass for comments that are replies (have parentId)
-        comment_cls = DiscussionReply if parent_id is not None else Comment
-        c = comment_cls(
-            cid=cid,
-            text=text,
-            author=author,
-            date_str=date_str,
-            parent_id=parent_id,
-        )
-        comments.append(c)
-        by_id[cid] = c
-        id_to_para[cid] = para_id
-
-    # Build threads: attach replies to their parent
-    top_level: List[Comment] = []
-    for c in comments:
-        if c.parent_id is None:
-            top_level.append(c)
-        else:
-            parent = by_id.get(c.parent_id)
-            if parent is not None:
-                parent.replies.append(c)
-            else:
-                # Orphan reply — treat as top-level to avoid losing it
+                if parent_attr is not None:
+                    try:
+                        parent_id = int(parent_attr)
+                    except ValueError:
+                        parent_id = None
+
+                author = node.get(_A_AUTHOR)
+                if author is None:
+                    # sometimes stored as w:initials or other fields; keep None if not present
+                    author = node.get(_A_INITIALS)
+                if author is not None:
+                    # A few authors write most comments; share one string per name
+                    author = sys.intern(author)
+
+                date_raw = node.get(_A_DATE)
+                date_str = _parse_datetime(date_raw)
+
+                text = _get_text_from_paragraphs(node)
+
+                # Use DiscussionReply subclass for comments that are replies (have parentId)
+                comment_cls = DiscussionReply if parent_id is not None else Comment
+                c = comment_cls(
+                    cid=cid,
+                    text=text,
+                    author=author,
+                    date_str=date_str,
+                    parent_id=parent_id,
+                )
+                comments.append(c)
+                by_id[cid] = c
+
+                # capture paraId from the first paragraph inside the comment (w14/w15)
+                if has_extended:
+                    first_p = next(node.iter(_T_P), None)
+                    if first_p is not None:
+                        para_id = first_p.get(_A_PARAID) or first_p.get(_A_PARAID_W14)
+                        if para_id:
+                            para_to_id[para_id] = cid
+
+        # Build threads: attach replies to their parent
+        top_level: List[Comment] = []
+        for c in comments:
+            if c.parent_id is None:
                 top_level.append(c)
-
-    # Fallback threading using commentsExtended.xml (w15:paraIdParent) if parentId missing
-    # Also read resolved status from commentsExtended.xml
-    try:
-        with zipfile.ZipFile(docx_path, "r") as zf:
-            with zf.open("word/commentsExtended.xml") as f:
-                ext_tree = ET.parse(f)
-                ext_root = ext_tree.getroot()
-                # Build paraId -> commentId map
-                para_to_id: Dict[str, int] = {}
-                for cid, pid in id_to_para.items():
-                    if pid:
-                        para_to_id[pid] = cid
-                # Iterate extended comment entries
-                for ex in ext_root.findall("w15:commentEx", NS):
-                    child_para = ex.get(f"{{{NS['w15']}}}paraId")
-                    parent_para = ex.get(f"{{{NS['w15']}}}paraIdParent")
-                    done_attr = ex.get(f"{{{NS['w15']}}}done", "0")
+            else:
+                parent = by_id.get(c.parent_id)
+                if parent is not None:
+                    parent.replies.append(c)
+                else:
+                    # Orphan reply — treat as top-level to avoid losing it
+                    top_level.append(c)
+
+        # Fallback threading using commentsExtended.xml (w15:paraIdParent) if parentId missing
+        # Also read resolved status from commentsExtended.xml
+        # Comments threaded here are dropped from top_level in one pass afterwards
+        demoted: set = set()
+        try:
+            # Entries are matched by paraId; without any there is nothing to match
+            if has_extended and para_to_id:
+                with io.BytesIO(zf.read("word/commentsExtended.xml")) as f:
+                    # Iterate extended comment entries
+                    for ex in _iter_child_elements(f, _T_COMMENT_EX):
+                        child_para = ex.get(_A_PARAID)
+                        parent_para = ex.get(_A_PARAIDPARENT)
+                        done_attr = ex.get(_A_DONE, "0")
                     
-                    # Check if comment is resolved (for both top-level and replies)
-                    if child_para:
-                        child_id = para_to_id.get(child_para)
-                        if child_id is not None:
-                            child_comment = by_id.get(child_id)
-                            if child_comment is not None:
-                                # Mark as resolved if done="1"
-                                child_comment.resolved = (done_attr == "1")
+                        # Check if comment is resolved (for both top-level and replies)
+                        if child_para:
+                            child_id = para_to_id.get(child_para)
+                            if child_id is not None:
+                                child_comment = by_id.get(child_id)
+                                if child_comment is not None:
+                                    # Mark as resolved if done="1"
+                                    child_comment.resolved = (done_attr == "1")
                     
-                    # Handle threading (only if both child and parent para exist)
-                    if not child_para or not parent_para:
-                        continue
-                    child_id = para_to_id.get(child_para)
-                    parent_id_from_para = para_to_id.get(parent_para)
-                    if child_id is None or parent_id_from_para is None:
+                        # Handle threading (only if both child and parent para exist)
+                        if not child_para or not parent_para:
+                            continue
+                        child_id = para_to_id.get(child_para)
+                        parent_id_from_para = para_to_id.get(parent_para)
+                        if child_id is None or parent_id_from_para is None:
+                            continue
+                        child_comment = by_id.get(child_id)
+                        parent_comment = by_id.get(parent_id_from_para)
+                        if not child_comment or not parent_comment:
+                            continue
+                        # If not already threaded via w:parentId, attach now
+                        if child_comment.parent_id is None:
+                            child_comment.parent_id = parent_comment.id
+                            parent_comment.replies.append(child_comment)
+                            demoted.add(child_comment)
+        except Exception:
+            # If the extended file doesn't exist or can't be parsed, ignore silently
+            pass
+        if demoted:
+            top_level = [c for c in top_level if c not in demoted]
+
+        # Build map of comment id -> (anchor paragraph text, marked text) from document.xml
+        try:
+            def render_paragraph_with_marker(p_elem: ET.Element, target_id: int) -> (str, str):
+                plain_parts: List[str] = []
+                marked_parts: List[str] = []
+                in_range = False
+                inserted = False
+                target = str(target_id)
+                # Only the elements that matter, selected in C with lxml
+                for elem in _anchor_nodes(p_elem):
+                    tag = _ANCHOR_LOCAL_NAMES.get(elem.tag) or elem.tag.split("}")[-1]
+                    if tag == "commentRangeStart" and elem.get(_A_ID) == target:
+                        in_range = True
                         continue
-                    child_comment = by_id.get(child_id)
-                    parent_comment = by_id.get(parent_id_from_para)
-                    if not child_comment or not parent_comment:
+                    if tag == "commentRangeEnd" and elem.get(_A_ID) == target:
+                        in_range = False
                         continue
-                    # If not already threaded via w:parentId, attach now
-                    if child_comment.parent_id is None:
-                        child_comment.parent_id = parent_comment.id
-                        parent_comment.replies.append(child_comment)
-                        if child_comment in top_level:
-                            top_level.remove(child_comment)
-    except Exception:
-        # If the extended file doesn't exist or can't be parsed, ignore silently
-        pass
-
-    # Build map of comment id -> (anchor paragraph text, marked text) from document.xml
-    try:
-        with zipfile.ZipFile(docx_path, "r") as zf:
-            with zf.open("word/document.xml") as f:
-                doc_tree = ET.parse(f)
-                doc_root = doc_tree.getroot()
-
-        def render_paragraph_with_marker(p_elem: ET.Element, target_id: int) -> (str, str):
-            plain_parts: List[str] = []
-            marked_parts: List[str] = []
-            in_range = False
-            inserted = False
-            target = str(target_id)
-            for elem in p_elem.iter():
-                tag = elem.tag.split("}")[-1]
-                if tag == "commentRangeStart" and elem.get(f"{{{NS['w']}}}id") == target:
-                    in_range = True
-                    continue
-                if tag == "commentRangeEnd" and elem.get(f"{{{NS['w']}}}id") == target:
-                    in_range = False
-                    continue
-                if tag == "t":
-                    txt = elem.text or ""
-                    plain_parts.append(txt)
-                    if in_range and not inserted:
-                        marked_parts.append("[1]")
-                        inserted = True
-                    marked_parts.append(txt)
-                elif tag == "br":
-                    plain_parts.append("\n")
-                    marked_parts.append("\n")
-            return ("".join(plain_parts).strip(), "".join(marked_parts).strip())
-
-        # Locate all paragraphs that contain comment range starts and map id -> paragraph
-        anchor_map: Dict[int, tuple] = {}
-        for p in doc_root.findall('.//w:p', NS):
-            # Find all commentRangeStart under this paragraph
-            for crs in p.findall('.//w:commentRangeStart', NS):
-                id_attr = crs.get(f"{{{NS['w']}}}id")
-                if not id_attr:
-                    continue
-                try:
-                    cid_int = int(id_attr)
-                except ValueError:
-                    continue
-                # Only compute once per id
-                if cid_int in anchor_map:
-                    continue
-                plain, marked = render_paragraph_with_marker(p, cid_int)
-                anchor_map[cid_int] = (plain, marked)
-
-        # Attach anchors to comments (top-level and replies independently)
-        for c in comments:
-            if c.id in anchor_map:
-                c.anchor_paragraph_text, c.anchor_paragraph_text_marked = anchor_map[c.id]
-
-        # Build list of all paragraphs in document order with heading info
-        def extract_paragraph_text(p_elem: ET.Element) -> str:
-            parts: List[str] = []
-            for t in p_elem.findall(".//w:t", NS):
-                if t.text:
-                    parts.append(t.text)
-            return "".join(parts).strip()
-
-        def is_heading(p_elem: ET.Element) -> tuple:
-            """Check if paragraph is a heading. Returns (is_heading, level, text)."""
-            p_pr = p_elem.find("w:pPr", NS)
-            if p_pr is None:
-                return (False, 0, "")
-            p_style = p_pr.find("w:pStyle", NS)
-            if p_style is None:
-                return (False, 0, "")
-            style_val = p_style.get(f"{{{NS['w']}}}val", "")
-            level = 0
-            if style_val.startswith("Heading"):
-                try:
-                    level = int(style_val.replace("Heading", ""))
-                except ValueError:
-                    pass
-            if level in (1, 2, 3):
-                text = extract_paragraph_text(p_elem)
-                return (True, level, text)
-            return (False, 0, "")
-
-        # Build ordered list of paragraphs with their positions and heading info
-        all_paragraphs: List[tuple[ET.Element, int, bool, int, str]] = []
-        para_index = 0
-        for p in doc_root.findall('.//w:p', NS):
-            is_h, h_level, h_text = is_heading(p)
-            all_paragraphs.append((p, para_index, is_h, h_level, h_text))
-            para_index += 1
-
-        # Map comment ID to paragraph index (where commentRangeStart appears)
-        comment_to_para_index: Dict[int, int] = {}
-        for idx, (p, _, _, _, _) in enumerate(all_paragraphs):
-            for crs in p.findall('.//w:commentRangeStart', NS):
-                id_attr = crs.get(f"{{{NS['w']}}}id")
-                if not id_attr:
-                    continue
-                try:
-                    cid_int = int(id_attr)
-                    if cid_int not in comment_to_para_index:
-                        comment_to_para_index[cid_int] = idx
-                except ValueError:
-                    continue
-
-        # For each comment, traverse backwards to find nearest heading and DSSxxx
-        dss_pattern = re.compile(r'DSS\d{1,3}', re.IGNORECASE)
-        for c in comments:
-            if c.id not in comment_to_para_index:
-                continue
-            comment_para_idx = comment_to_para_index[c.id]
-            nearest_heading: Optional[tuple[int, int, str]] = None  # (index, level, text)
-            requirement_id: Optional[str] = None
-
-            # Traverse backwards from comment paragraph
-            for i in range(comment_para_idx, -1, -1):
-                p_elem, p_idx, is_h, h_level, h_text = all_paragraphs[i]
-                distance = comment_para_idx - p_idx
-                
-                if is_h and h_level in (1, 2, 3):
-                    # Found a heading - check if it's closer than previous
-                    if nearest_heading is None:
-                        nearest_heading = (p_idx, h_level, h_text)
-                    else:
-                        prev_distance = comment_para_idx - nearest_heading[0]
-                        # If closer, or same distance but higher level (h1 > h2 > h3)
-                        if distance < prev_distance or (distance == prev_distance and h_level < nearest_heading[1]):
-                            nearest_heading = (p_idx, h_level, h_text)
-                
-                # Search for DSSxxx pattern in this paragraph's text (only between comment and heading)
-                if requirement_id is None:
-                    para_text = extract_paragraph_text(p_elem)
-                    match = dss_pattern.search(para_text)
+                    if tag == "t":
+                        txt = elem.text or ""
+                        plain_parts.append(txt)
+                        if in_range and not inserted:
+                            marked_parts.append("[1]")
+                            inserted = True
+                        marked_parts.append(txt)
+                    elif tag == "br":
+                        plain_parts.append("\n")
+                        marked_parts.append("\n")
+                return ("".join(plain_parts).strip(), "".join(marked_parts).strip())
+
+            # Build list of all paragraphs in document order with heading info
+            def extract_paragraph_text(p_elem: ET.Element) -> str:
+                return "".join([t.text for t in p_elem.iter(_T_T) if t.text]).strip()
+
+            def is_heading(p_elem: ET.Element, p_text: str) -> tuple:
+                """Check if paragraph (with text p_text) is a heading. Returns (is_heading, level, text)."""
+                p_pr = p_elem.find(_T_PPR)
+                if p_pr is None:
+                    return (False, 0, "")
+                p_style = p_pr.find(_T_PSTYLE)
+                if p_style is None:
+                    return (False, 0, "")
+                style_val = p_style.get(_A_VAL, "")
+                if not style_val.startswith("Heading"):
+                    return (False, 0, "")
+                # Dict lookup on the suffix instead of int() in a try
+                level = _HEADING_LEVELS.get(style_val[7:].strip())
+                if level is None:
+                    return (False, 0, "")
+                return (True, level, p_text)
+
+            # One pass over the paragraphs in document order: heading info for every paragraph, and for
+            # every comment the paragraph where its range starts (first occurrence wins) and its anchor text
+            # document.xml is streamed, so per paragraph only what the comments need is kept:
+            # the nearest heading and the last requirement ID at or before it (None before the first)
+            heading_before: List[Optional[str]] = []
+            dss_before: List[Optional[str]] = []
+            last_heading: Optional[str] = None
+            last_dss: Optional[str] = None
+            comment_to_para_index: Dict[int, int] = {}
+            anchor_map: Dict[int, tuple] = {}
+            doc_source = io.BytesIO(zf.read("word/document.xml"))
+            for outer_p in _iter_outer_paragraphs(doc_source):
+                # Paragraphs nested in text boxes come right after their outer paragraph, in document order
+                for p in outer_p.iter(_T_P):
+                    para_index = len(heading_before)
+                    # Text is extracted once per paragraph, for the heading and the DSS search alike
+                    para_text = extract_paragraph_text(p)
+                    is_h, h_level, h_text = is_heading(p, para_text)
+                    if is_h:
+                        last_heading = h_text
+                    heading_before.append(last_heading)
+                    match = _DSS_RE.search(para_text)
                     if match:
-                        requirement_id = match.group(0).upper()
+                        last_dss = match.group(0).upper()
+                    dss_before.append(last_dss)
+
+                    # Find all commentRangeStart under this paragraph
+                    for crs in p.iter(_T_COMMENT_RANGE_START):
+                        id_attr = crs.get(_A_ID)
+                        if not id_attr:
+                            continue
+                        try:
+                            cid_int = int(id_attr)
+                        except ValueError:
+                            continue
+                        # Only compute once per id
+                        if cid_int in comment_to_para_index:
+                            continue
+                        comment_to_para_index[cid_int] = para_index
+                        anchor_map[cid_int] = render_paragraph_with_marker(p, cid_int)
+
+            # Attach anchors to comments (top-level and replies independently)
+            for c in comments:
+                if c.id in anchor_map:
+                    c.anchor_paragraph_text, c.anchor_paragraph_text_marked = anchor_map[c.id]
+
+            # For each comment, the closest heading and DSSxxx are the last ones at or before its paragraph
+            for c in comments:
+                if c.id not in comment_to_para_index:
+                    continue
+                comment_para_idx = comment_to_para_index[c.id]
+                nearest_heading = heading_before[comment_para_idx]
+                requirement_id = dss_before[comment_para_idx]
 
-            if nearest_heading:
-                c.nearest_heading = nearest_heading[2]
-            if requirement_id:
-                c.requirement_ID = requirement_id
+                if nearest_heading is not None:
+                    c.nearest_heading = nearest_heading
+                if requirement_id:
+                    c.requirement_ID = requirement_id
 
-    except Exception:
-        # If document.xml isn't readable, skip anchors silently
-        pass
+        except Exception:
+            # If document.xml isn't readable, skip anchors silently
+            pass
 
     # Preserve original order as in comments.xml for top-level threads
-    id_order = [c.id for c in comments if c.parent_id is None]
-    top_level.sort(key=lambda c: id_order.index(c.id) if c.id in id_order else 10**9)
+    rank: Dict[int, int] = {}
+    for c in comments:
+        if c.parent_id is None:
+            # First occurrence wins, as with list.index()
+            rank.setdefault(c.id, len(rank))
+    top_level.sort(key=lambda c: rank.get(c.id, 10**9))
 
     # Filter out resolved comments recursively
     def filter_resolved(comment: Comment) -> Optional[Comment]:
@@ -398,85 +554,132 @@ def extract_comments_threads(docx_path: str) -> List[Comment]:
     
     return filtered_top_level
 
-def _print_replies_recursive(comment: Comment, depth: int = 1) -> None:
-    if not comment.replies:
-        return
-    # Label for nested subconversations
-    indent = "  " * depth
-    print(f"\n{indent}Subconversation (level {depth}):")
-    for idx, r in enumerate(comment.replies, start=1):
-        r_author = r.author or "Unknown"
-        r_date = r.date_str or "Unknown date"
-        label = "Reply" if isinstance(r, DiscussionReply) else "Comment"
-        print(f"{indent}  [{idx}] {label} ID {r.id}")
-        print(f"{indent}      Author: {r_author}")
-        print(f"{indent}      Date:   {r_date}")
-        print(f"{indent}      Text:")
-        body = r.text if r.text else "(no text)"
+def _extract_comments_threads_safe(docx_path: str) -> Tuple[str, List[Comment], Optional[str]]:
+    """Pool worker: extract the threads of one file, reporting a failure as a message instead of raising."""
+    try:
+        return docx_path, extract_comments_threads(docx_path), None
+    except zipfile.BadZipFile:
+        return docx_path, [], "not a valid .docx (zip) file"
+    except Exception as e:
+        return docx_path, [], f"failed to read comments: {e}"
+
+def extract_comments_threads_from_folder(folder: str) -> Dict[str, List[Comment]]:
+    """Extract the threads of every .docx below a folder, in parallel worker processes.
+
+    Returns file path -> threads in path order. Unreadable files are reported on stderr and left out.
+    """
+    docx_paths = sorted(
+        path for path in glob.glob(os.path.join(folder, "**", "*.docx"), recursive=True)
+        # Skip the lock files Word keeps next to open documents
+        if not os.path.basename(path).startswith("~$")
+    )
+    if not docx_paths:
+        return {}
+
+    processes = min(len(docx_paths), os.cpu_count() or 1)
+    chunksize = max(1, len(docx_paths) // (processes * 4))
+    results: Dict[str, List[Comment]] = {}
+    with multiprocessing.Pool(processes) as pool:
+        for path, threads, error in pool.imap_unordered(_extract_comments_threads_safe, docx_paths, chunksize):
+            if error:
+                print(f"{path}: {error}", file=sys.stderr)
+            else:
+                results[path] = threads
+    # Files finish in any order; report them in path order
+    return {path: results[path] for path in docx_paths if path in results}
+
+def _format_replies(comment: Comment, lines: List[str], depth: int = 1) -> None:
+    # Explicit stack instead of recursion: (comment, depth, None) lists the replies of a comment,
+    # (reply, depth, idx) formats one reply. Pushed in reverse so they pop in document order.
+    stack: List[Tuple[Comment, int, Optional[int]]] = [(comment, depth, None)]
+    while stack:
+        c, depth, idx = stack.pop()
+        # Label for nested subconversations
+        indent = "  " * depth
+        if idx is None:
+            if c.replies:
+                lines.append(f"\n{indent}Subconversation (level {depth}):")
+                for i in range(len(c.replies), 0, -1):
+                    stack.append((c.replies[i - 1], depth, i))
+            continue
+        r_author = c.author or "Unknown"
+        r_date = c.date_str or "Unknown date"
+        label = "Reply" if isinstance(c, DiscussionReply) else "Comment"
+        lines.append(f"{indent}  [{idx}] {label} ID {c.id}")
+        lines.append(f"{indent}      Author: {r_author}")
+        lines.append(f"{indent}      Date:   {r_date}")
+        lines.append(f"{indent}      Text:")
+        body = c.text if c.text else "(no text)"
         for line in (body.splitlines() or ["(no text)"]):
-            print(f"{indent}        {line}")
-        # Recurse for deeper nested replies
-        _print_replies_recursive(r, depth + 1)
+            lines.append(f"{indent}        {line}")
+        # Deeper nested replies come right after this one
+        stack.append((c, depth + 1, None))
 
 def print_first_n_threads(threads: List[Comment], n: int = 5) -> None:
+    # Collect all lines and write them at once instead of one print() per line
+    lines: List[str] = []
     count = 0
     for thread in threads:
         if count >= n:
             break
-        print("=" * 80)
+        lines.append("=" * 80)
         header = f"Thread #{count + 1} - Comment ID {thread.id}"
-        print(header)
-        print("-" * len(header))
+        lines.append(header)
+        lines.append("-" * len(header))
         author = thread.author or "Unknown"
         date_display = thread.date_str or "Unknown date"
-        print(f"Author: {author}")
-        print(f"Date:   {date_display}")
-        print("Comment:")
-        print(thread.text if thread.text else "(no text)")
+        lines.append(f"Author: {author}")
+        lines.append(f"Date:   {date_display}")
+        lines.append("Comment:")
+        lines.append(thread.text if thread.text else "(no text)")
 
         if thread.anchor_paragraph_text_marked:
-            print("\nAnchor paragraph (with marker):")
+            lines.append("\nAnchor paragraph (with marker):")
             for line in thread.anchor_paragraph_text_marked.splitlines():
-                print(f"  {line}")
+                lines.append(f"  {line}")
 
-        # Print replies recursively as subconversations
-        _print_replies_recursive(thread, depth=1)
+        # Add replies as subconversations
+        _format_replies(thread, lines, depth=1)
         count += 1
 
     if count == 0:
-        print("No comments found.")
+        lines.append("No comments found.")
     else:
-        print("=" * 80)
+        lines.append("=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def _extract_sheet_id(url: str) -> Optional[str]:
-    pattern = r'/spreadsheets/d/([a-zA-Z0-9\-_]+)'
-    m = re.search(pattern, url)
+    m = _SHEET_ID_RE.search(url)
     return m.group(1) if m else None
 
+# Candidate credential files, tried in order when GOOGLE_CREDENTIALS_PATH is not set
+_POSSIBLE_CRED_PATHS = [
+    '/Users/vasilenkoilya/Documents/7 GitHub Cursor/cms-assistant/.vscode/client_secret_1049835516666-5v9s988evv40904gof6p0i7l93f57go7.apps.googleusercontent.com.json',
+    'credentials.json',
+    'client_secret.json',
+    os.path.expanduser('~/.config/gspread/credentials.json'),
+]
+_AUTHORIZED_USER_PATHS = [
+    '.vscode/authorized_user.json',
+    'authorized_user.json',
+    os.path.expanduser('~/.config/gspread/authorized_user.json'),
+]
+
+# Authenticate once per process; repeated exports reuse the client
+@functools.lru_cache(maxsize=1)
 def _setup_gspread_client() -> Optional[gspread.Client]:
     try:
         credentials_path = os.getenv('GOOGLE_CREDENTIALS_PATH')
         if not credentials_path:
-            possible_paths = [
-                '/Users/vasilenkoilya/Documents/7 GitHub Cursor/cms-assistant/.vscode/client_secret_1049835516666-5v9s988evv40904gof6p0i7l93f57go7.apps.googleusercontent.com.json',
-                'credentials.json',
-                'client_secret.json',
-                os.path.expanduser('~/.config/gspread/credentials.json'),
-            ]
-            for path in possible_paths:
+            for path in _POSSIBLE_CRED_PATHS:
                 if os.path.exists(path):
                     credentials_path = path
                     break
 
         if credentials_path and os.path.exists(credentials_path):
             try:
-                authorized_user_paths = [
-                    '.vscode/authorized_user.json',
-                    'authorized_user.json',
-                    os.path.expanduser('~/.config/gspread/authorized_user.json'),
-                ]
                 authorized_user_path = None
-                for path in authorized_user_paths:
+                for path in _AUTHORIZED_USER_PATHS:
                     if os.path.exists(path):
                         authorized_user_path = path
                         break
@@ -510,14 +713,14 @@ def _format_thread_text(thread: Comment) -> str:
     author = thread.author or 'Unknown'
     body = thread.text or ''
     lines.append(f"[1] {author}: {body}")
-    # Replies lines
-    def walk(c: Comment):
-        for r in c.replies:
-            r_author = r.author or 'Unknown'
-            r_body = r.text or ''
-            lines.append(f"{r_author}: {r_body}")
-            walk(r)
-    walk(thread)
+    # Replies lines, depth-first in document order via an explicit stack
+    stack: List[Comment] = thread.replies[::-1]
+    while stack:
+        r = stack.pop()
+        r_author = r.author or 'Unknown'
+        r_body = r.text or ''
+        lines.append(f"{r_author}: {r_body}")
+        stack.extend(reversed(r.replies))
     return "\n".join(lines)
 
 def export_threads_to_gsheet(threads: List[Comment], spreadsheet_url: str) -> bool:
@@ -543,10 +746,30 @@ def export_threads_to_gsheet(threads: List[Comment], spreadsheet_url: str) -> bo
             anchor = thread.anchor_paragraph_text_marked or thread.anchor_paragraph_text or ''
             thread_text = _format_thread_text(thread)
             rows.append([heading, req_id, anchor, thread_text])
-        # Overwrite existing data
-        ws.clear()
+        # Overwrite existing data: clear the old values and write the new ones (as plain strings,
+        # like RAW input) in one batchUpdate request instead of two round trips
+        requests: List[dict] = [
+            {"updateCells": {"range": {"sheetId": ws.id}, "fields": "userEnteredValue"}},
+        ]
+        # Unlike a values update, updateCells does not grow the grid by itself
+        if len(rows) > ws.row_count:
+            requests.append({"appendDimension": {
+                "sheetId": ws.id, "dimension": "ROWS", "length": len(rows) - ws.row_count,
+            }})
+        if rows and len(rows[0]) > ws.col_count:
+            requests.append({"appendDimension": {
+                "sheetId": ws.id, "dimension": "COLUMNS", "length": len(rows[0]) - ws.col_count,
+            }})
         if rows:
-            ws.update('A1', rows, value_input_option='RAW')
+            requests.append({"updateCells": {
+                "start": {"sheetId": ws.id, "rowIndex": 0, "columnIndex": 0},
+                "rows": [
+                    {"values": [{"userEnteredValue": {"stringValue": value}} for value in row]}
+                    for row in rows
+                ],
+                "fields": "userEnteredValue",
+            }})
+        ss.batch_update({"requests": requests})
         print(f"Exported {len(rows)} threads to Google Sheet (first sheet).")
         return True
     except Exception as e:
@@ -554,25 +777,36 @@ def export_threads_to_gsheet(threads: List[Comment], spreadsheet_url: str) -> bo
         return False
 
 def main():
-    # Allow optional CLI override of the path
+    # Allow optional CLI override of the path (a .docx file or a folder of them)
     if len(sys.argv) > 1:
         docx_path = sys.argv[1]
     else:
         docx_path = DOCX_RELATIVE_PATH
 
-    try:
-        threads = extract_comments_threads(docx_path)
-    except FileNotFoundError as e:
-        print(str(e), file=sys.stderr)
-        sys.exit(1)
-    except zipfile.BadZipFile:
-        print("The specified file is not a valid .docx (zip) file.", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        print(f"Failed to read comments: {e}", file=sys.stderr)
-        sys.exit(1)
-
-    print_first_n_threads(threads, n=5)
+    if os.path.isdir(docx_path):
+        threads_by_file = extract_comments_threads_from_folder(docx_path)
+        if not threads_by_file:
+            print(f"No readable .docx files found in: {docx_path}", file=sys.stderr)
+            sys.exit(1)
+        threads: List[Comment] = []
+        for path, file_threads in threads_by_file.items():
+            print(f"\nFile: {path}")
+            print_first_n_threads(file_threads, n=5)
+            threads.extend(file_threads)
+    else:
+        try:
+            threads = extract_comments_threads(docx_path)
+        except FileNotFoundError as e:
+            print(str(e), file=sys.stderr)
+            sys.exit(1)
+        except zipfile.BadZipFile:
+            print("The specified file is not a valid .docx (zip) file.", file=sys.stderr)
+            sys.exit(1)
+        except Exception as e:
+            print(f"Failed to read comments: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        print_first_n_threads(threads, n=5)
 
     # Export all threads to the specified Google Sheet (first worksheet)
     export_url = 'https://docs.google.com/spreadsheets/d/1dIdHfVIDn_YQo6F93SyN5e8JddLR1muHZgYyv6MAWRA/edit?gid=0#gid=0'